@@ -0,0 +1,719 @@
+# bench.py
+# 가짜 SPI/Pin 위에서 TFT 드라이버의 버스 비용을 재는 벤치마크
+# PC(CPython)에서:  python bench.py
+# 보드에서도 import bench; bench.run() 으로 실행 가능 (실제 화면은 건드리지 않음)
+import gc
+import sys
+import time
+
+# PC에서는 machine 대역이 time.sleep을 가상 시계로 바꾸므로 실제 sleep을 먼저 잡아둠
+_real_sleep = time.sleep
+
+try:
+    import machine
+except ImportError:
+    # PC에서는 host/ 의 machine 대역(가상 패널/시계)을 씀
+    sys.path.insert(0, "host")
+    import machine
+
+import st7735
+from bubblegrid import BubbleGrid
+import maze
+import levels
+import sprites
+
+
+class FakePin(object):
+    # CS 핀이 0으로 떨어질 때마다 트랜잭션 1회로 센다
+    def __init__(self, counter=None):
+        self._v = 1
+        self._counter = counter
+
+    def value(self, v=None):
+        if v is None:
+            return self._v
+        if self._counter is not None and self._v == 1 and v == 0:
+            self._counter.transactions += 1
+        self._v = v
+
+
+class FakeSPI(object):
+    def __init__(self):
+        self.transactions = 0
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, data):
+        self.writes += 1
+        self.bytes += len(data)
+
+    def reset(self):
+        self.transactions = 0
+        self.writes = 0
+        self.bytes = 0
+
+
+_failed = []
+
+
+def check(name, ok, good="일치", bad="불일치!"):
+    # 검증 결과 출력, 틀리면 기록해 두었다가 run() 끝에서 실패로 끝냄
+    print("  %-10s %s" % (name, good if ok else bad))
+    if not ok:
+        _failed.append(name)
+    return ok
+
+
+def make_tft():
+    spi = FakeSPI()
+    tft = st7735.TFT(spi, FakePin(), FakePin(), FakePin(spi))
+    return tft, spi
+
+
+class RecordSPI(object):
+    # 전송 내용을 (DC, 바이트) 순서대로 기록하고, 40MHz 버스처럼 전송 시간만큼 기다림
+    def __init__(self, delay=True):
+        self.dc = None
+        self.delay = delay
+        self.log = []
+
+    def write(self, data):
+        dc = self.dc.value()
+        if self.log and self.log[-1][0] == dc and dc == 1:
+            self.log[-1][1].extend(data)
+        else:
+            self.log.append((dc, bytearray(data)))
+        if self.delay:
+            _real_sleep(len(data) * 8 / 40000000)
+
+
+def _old_transactions(pixels, pixel=False):
+    # 예전 드라이버의 CS 트랜잭션 수 - 비교용
+    # 창 설정: 명령/데이터 바이트마다 CS를 내림 (CASET + 4 + RASET + 4 + RAMWR = 11번)
+    # 픽셀: fillrect는 1024픽셀 덩어리마다 1번, pixel은 상위/하위 바이트 따로 2번
+    if pixel:
+        return 11 + 2
+    return 11 + (pixels + 1023) // 1024
+
+
+def bench_fillrect_transactions():
+    # fillrect 한 번당 CS 트랜잭션 수 (창 설정 + 픽셀 데이터), 예전 드라이버보다 적어야 함
+    tft, spi = make_tft()
+    print("fillrect 버스 트랜잭션")
+    fewer = True
+    for w, h in ((2, 2), (11, 11), (128, 27), (128, 160)):
+        spi.reset()
+        tft.fillrect(0, 0, w, h, st7735.RED)
+        old = _old_transactions(w * h)
+        fewer = fewer and spi.transactions < old
+        print("  %3dx%-3d  트랜잭션 %3d (예전 %3d)  write %3d  바이트 %6d" % (
+            w, h, spi.transactions, old, spi.writes, spi.bytes))
+    spi.reset()
+    tft.pixel(5, 5, st7735.RED)
+    old = _old_transactions(1, True)
+    fewer = fewer and spi.transactions < old
+    print("  pixel    트랜잭션 %3d (예전 %3d)  write %3d  바이트 %6d" % (
+        spi.transactions, old, spi.writes, spi.bytes))
+    check("예전 대비", fewer, "모두 적음", "줄지 않은 경우 있음!")
+
+
+# 힙 할당 측정은 두 환경에서 재는 값이 다름 (출력에도 구분해서 표시)
+#   MicroPython: gc.mem_alloc() 증가량 / 호출 수 = 1회 평균 할당 바이트 ("B/회")
+#   CPython: tracemalloc은 누적 할당량을 모르므로, 반복하는 동안 잠깐 잡은 최대 바이트 ("B 최대")
+#            호출이 끝나면 버리는 임시 버퍼 크기에 가까움 (호출 수로 나누지 않음)
+ALLOC_UNIT = "B/회" if hasattr(gc, "mem_alloc") else "B 최대"
+
+
+def _alloc_start():
+    gc.collect()
+    if hasattr(gc, "mem_alloc"):
+        gc.disable()
+        return gc.mem_alloc()
+    import tracemalloc
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _alloc_stop(start, calls):
+    # ALLOC_UNIT 단위의 값
+    if hasattr(gc, "mem_alloc"):
+        used = gc.mem_alloc() - start
+        gc.enable()
+        return used / calls
+    import tracemalloc
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - start
+
+
+def bench_fillrect_alloc(calls=200):
+    # 게임에서 자주 쓰는 크기별 fillrect 1회당 힙 할당량과 SPI 바이트
+    tft, spi = make_tft()
+    tft.fillrect(0, 0, 1, 1, st7735.BLACK)  # 첫 호출 준비 비용 제외
+    print("fillrect 힙 할당 (%d회 반복, 할당 단위 %s)" % (calls, ALLOC_UNIT))
+    for w, h in ((2, 2), (7, 7), (11, 11), (128, 27), (128, 160)):
+        spi.reset()
+        start = _alloc_start()
+        t0 = time.time()
+        for i in range(calls):
+            # 조준선처럼 색이 번갈아 바뀌는 경우
+            tft.fillrect(0, 0, w, h, st7735.WHITE if i & 1 else st7735.BLACK)
+        elapsed = time.time() - t0
+        used = _alloc_stop(start, calls)
+        print("  %3dx%-3d  할당 %7.1f %s  SPI %6d B/회  %6.1f us/회" % (
+            w, h, used, ALLOC_UNIT, spi.bytes // calls, elapsed * 1000000 / calls))
+
+
+def _old_check_matches(grid, r, c, color, visited, rows, cols):
+    # 예전 game.check_matches (재귀 + 8방향) - 비교용
+    if (r, c) in visited: return []
+    if r < 0 or r >= rows or c < 0 or c >= cols: return []
+    if grid[r][c] != color: return []
+    visited.add((r, c))
+    matches = [(r, c)]
+    for dr, dc in [(-1,0), (1,0), (0,-1), (0,1), (-1,-1), (-1,1), (1,-1), (1,1)]:
+        matches += _old_check_matches(grid, r+dr, c+dc, color, visited, rows, cols)
+    return matches
+
+
+def _ref_hex_component(grid, starts, color, rows, cols):
+    # 검증용 단순 BFS (set 사용, 육각 이웃을 좌표로 직접 계산)
+    seen = set(starts)
+    todo = list(starts)
+    while todo:
+        r, c = todo.pop()
+        cx = c * 2 + (r % 2)
+        for nr in (r - 1, r, r + 1):
+            for nc in (c - 1, c, c + 1):
+                if (nr, nc) in seen or not (0 <= nr < rows and 0 <= nc < cols):
+                    continue
+                ncx = nc * 2 + (nr % 2)
+                near = abs(ncx - cx) == 1 if nr != r else abs(nc - c) == 1
+                v = grid[nr][nc]
+                if near and v != 0 and (color is None or v == color):
+                    seen.add((nr, nc))
+                    todo.append((nr, nc))
+    return seen
+
+
+def _old_hit(grid, bx, by):
+    # 예전 game.run_bubble_game 충돌 검사 (모든 차 있는 칸과 거리 비교) - 비교용
+    d = grid.dia - 1
+    for i in range(len(grid.cells)):
+        if grid.cells[i] != 0:
+            ddx = bx - grid.cx[i]
+            ddy = by - grid.cy[i]
+            if ddx * ddx + ddy * ddy < d * d:
+                return True
+    return False
+
+
+def _old_snap(grid, bx, by):
+    # 예전 착지 칸 찾기 (모든 빈 칸 중 가장 가까운 첫 칸) + 지금의 착지 허용 거리(지름 1.5배)
+    best_d2 = None
+    best = -1, -1
+    for i in range(len(grid.cells)):
+        if grid.cells[i] == 0:
+            ddx = bx - grid.cx[i]
+            ddy = by - grid.cy[i]
+            dd = ddx * ddx + ddy * ddy
+            if best_d2 is None or dd < best_d2:
+                best_d2 = dd
+                best = divmod(i, grid.cols)
+    d = grid.dia * 3 // 2
+    if best_d2 is None or best_d2 >= d * d:
+        return -1, -1
+    return best
+
+
+def bench_grid_collision(boards=20000):
+    # 충돌/착지 판정: 주변 칸만 보는 HexGrid 방식이 예전 전체 스캔과 같은 답을 내는지
+    # 보드마다 무작위 위치 하나 (고정소수점 좌표, float 버전은 같은 값을 나눠서)
+    import random
+    from bubblegrid import FP_SHIFT
+    rows, cols = 15, 11
+    random.seed(6)
+    grid = BubbleGrid(rows, cols, 7, 12, 5)
+    same = 0
+    t_old = t_new = 0.0
+    for _ in range(boards):
+        grid.clear()
+        fill = random.random()
+        for i in range(random.randint(0, rows) * cols):
+            if random.random() < fill:
+                grid.set_index(i, random.randint(1, 5))
+        if random.random() < 0.5:
+            grid.push_row([random.randint(0, 5) for c in range(cols)])
+        fx = random.randint(-10 << FP_SHIFT, 170 << FP_SHIFT)
+        fy = random.randint(-10 << FP_SHIFT, 200 << FP_SHIFT)
+        bx = fx / (1 << FP_SHIFT)
+        by = fy / (1 << FP_SHIFT)
+
+        t0 = time.time()
+        ref = (_old_hit(grid, bx, by), _old_snap(grid, bx, by))
+        t_old += time.time() - t0
+        t0 = time.time()
+        got = (grid.hit(bx, by), grid.snap(bx, by))
+        t_new += time.time() - t0
+        same += got == ref and (grid.hit_fp(fx, fy), grid.snap_fp(fx, fy)) == ref
+    print("버블 충돌/착지 판정 (무작위 보드 %d개)" % boards)
+    print("  전체 스캔   %7.1f us/회" % (t_old * 1000000 / boards))
+    print("  주변 칸만   %7.1f us/회" % (t_new * 1000000 / boards))
+    check("결과 검증", same == boards)
+
+
+def bench_bubble_matches(boards=200):
+    # 15줄이 꽉 찬 보드에서 같은 색 찾기 + 떨어질 묶음 찾기
+    import random
+    rows, cols = 15, 11
+    random.seed(1)
+    tests = []
+    for _ in range(boards):
+        ncolors = random.choice((1, 2, 3))
+        cells = [[random.randint(1, ncolors) if random.random() < 0.9 else 0
+                  for c in range(cols)] for r in range(rows)]
+        grid = BubbleGrid(rows, cols, 7, 12, 3)
+        for r in range(rows):
+            for c in range(cols):
+                grid.set(r, c, cells[r][c])
+        tests.append((cells, grid, random.randrange(rows), random.randrange(cols)))
+
+    ok = True
+    for cells, grid, r, c in tests:
+        ok = ok and grid.count == sum(1 for row in cells for v in row if v)
+        if cells[r][c] == 0:
+            continue
+        got = set(divmod(i, cols) for i in grid.matches(r, c))
+        ok = ok and got == _ref_hex_component(cells, [(r, c)], cells[r][c], rows, cols)
+        tops = [(0, x) for x in range(cols) if cells[0][x] != 0]
+        attached = _ref_hex_component(cells, tops, None, rows, cols)
+        ref = set((y, x) for y in range(rows) for x in range(cols) if cells[y][x] != 0) - attached
+        ok = ok and set(divmod(i, cols) for i in grid.floating()) == ref
+
+    t0 = time.time()
+    for cells, grid, r, c in tests:
+        if cells[r][c] != 0:
+            _old_check_matches(cells, r, c, cells[r][c], set(), rows, cols)
+    t_old = time.time() - t0
+    t0 = time.time()
+    for cells, grid, r, c in tests:
+        grid.matches(r, c)
+    t_new = time.time() - t0
+    t0 = time.time()
+    for cells, grid, r, c in tests:
+        grid.floating()
+    t_float = time.time() - t0
+
+    print("버블 묶음 찾기 (%dx%d 보드 %d개)" % (rows, cols, boards))
+    check("결과 검증", ok)
+    print("  예전 재귀   %7.1f us/회" % (t_old * 1000000 / boards))
+    print("  스택 방식   %7.1f us/회" % (t_new * 1000000 / boards))
+    print("  떠 있는 칸  %7.1f us/회" % (t_float * 1000000 / boards))
+
+
+def bench_text(calls=200):
+    # text(): 매번 새 문자열(점수가 계속 바뀜) vs 같은 문자열 반복(캐시 적중)
+    tft, spi = make_tft()
+    print("text 출력 (%d회)" % calls)
+    for name, label in (("매번 다른 문자열", lambda i: "SCORE %d" % i),
+                        ("같은 문자열 반복", lambda i: "SCORE 100")):
+        spi.reset()
+        t0 = time.time()
+        for i in range(calls):
+            tft.text(0, 0, label(i), st7735.WHITE, st7735.BLACK, 2)
+        elapsed = time.time() - t0
+        print("  %-16s 트랜잭션 %2d  바이트 %5d  %7.1f us/회" % (
+            name, spi.transactions // calls, spi.bytes // calls, elapsed * 1000000 / calls))
+
+
+def _circle_bubble(tft, x, y, r, color):
+    # 예전 game.draw_circle (원 + 하이라이트) - 비교용
+    tft.fillcircle(x, y, r, color)
+    if color != st7735.BLACK:
+        h = (r + 1) >> 1
+        tft.fillrect(x - h, y - h, 2, 2, st7735.WHITE)
+
+
+def bench_bubble_sprites(paints=20):
+    # 버블 보드 첫 화면 (4줄 x 11칸): fillcircle vs 스프라이트 blit, 그린 결과가 같은지도 확인
+    import random
+    palette = [st7735.BLACK, st7735.RED, st7735.GREEN, st7735.BLUE,
+               st7735.YELLOW, st7735.MAGENTA, st7735.CYAN]
+    grid = BubbleGrid(15, 11, 7, 12, 6)
+    random.seed(3)
+    board = [(grid.cx[i], grid.cy[i], random.randint(1, 6)) for i in range(4 * 11)]
+    print("버블 보드 그리기 (버블 %d개)" % len(board))
+    fbs = []
+    for name, sprite in (("fillcircle", False), ("스프라이트", True)):
+        tft, spi = make_tft()
+        cache = sprites.BubbleSprites(tft, 5, palette)
+        for x, y, v in board:
+            if sprite:
+                cache.draw(x, y, v)
+            else:
+                _circle_bubble(tft, x, y, 5, palette[v])
+        ta, nb = spi.transactions, spi.bytes
+        tft.framebuffer()
+        t0 = time.time()
+        for _ in range(paints):
+            for x, y, v in board:
+                if sprite:
+                    cache.draw(x, y, v)
+                else:
+                    _circle_bubble(tft, x, y, 5, palette[v])
+        elapsed = time.time() - t0
+        fbs.append(bytes(tft._fb))
+        print("  %-10s 직접 모드 트랜잭션 %4d  바이트 %6d   프레임버퍼 %6.2f ms/보드" % (
+            name, ta, nb, elapsed * 1000 / paints))
+    check("그린 결과", fbs[0] == fbs[1])
+
+
+def bench_bubble_push(pushes=20):
+    # 보드에 한 줄 넣기 (160x105 띠): 프레임버퍼 스크롤 + 새 줄 vs 보드 전체 다시 그리기
+    # 두 방법의 화면이 같은지도 확인
+    import random
+    palette = [st7735.BLACK, st7735.RED, st7735.GREEN, st7735.BLUE,
+               st7735.YELLOW, st7735.MAGENTA, st7735.CYAN]
+    print("버블 줄 내리기 (%d번)" % pushes)
+    fbs = []
+    for name, scroll in (("다시 그리기", False), ("스크롤", True)):
+        tft, spi = make_tft()
+        tft.rotation(1)
+        tft.framebuffer()
+        cache = sprites.BubbleSprites(tft, 5, palette)
+        grid = BubbleGrid(15, 11, 7, 12, 6)
+        random.seed(4)
+        for i in range(4 * 11):
+            grid.set_index(i, random.randint(1, 6))
+        for i in range(len(grid.cells)):
+            if grid.cells[i]:
+                cache.draw(grid.cx[i], grid.cy[i], grid.cells[i])
+        tft.flush()
+        spi.reset()
+        elapsed = 0.0
+        for _ in range(pushes):
+            if grid.lowest_row() >= 7:
+                for i in range(len(grid.cells) - 11 * 4, len(grid.cells)):
+                    grid.set_index(i, 0)
+            row = [random.randint(1, 6) for _ in range(11)]
+            t0 = time.time()
+            grid.push_row(row)
+            if scroll:
+                tft.scroll(0, 105, 12, st7735.BLACK)
+                for c in range(11):
+                    cache.draw(grid.cx[c], grid.cy[c], grid.cells[c])
+            else:
+                tft.fillrect(0, 0, 160, 105, st7735.BLACK)
+                for i in range(len(grid.cells)):
+                    if grid.cells[i]:
+                        cache.draw(grid.cx[i], grid.cy[i], grid.cells[i])
+            elapsed += time.time() - t0
+            tft.flush()
+        fbs.append(bytes(tft._fb[:160 * 105 * 2]))
+        print("  %-10s %6.2f ms/회  flush 바이트 %6d/회" % (
+            name, elapsed * 1000 / pushes, spi.bytes // pushes))
+    check("그린 결과", fbs[0] == fbs[1])
+
+    # 패널 하드웨어 스크롤 (세로 화면에서만 화면 세로축): 줄 이동은 명령 1번, 새로 드러난 줄만 그림
+    tft, spi = make_tft()
+    tft.vscroll_area(0, 160)
+    spi.reset()
+    start = 0
+    for _ in range(pushes):
+        start = (start - 12) % 160
+        tft.vscroll(start)
+    cmd = spi.bytes // pushes
+    spi.reset()
+    for _ in range(pushes):
+        tft.fillrect(0, start, 128, 12, st7735.BLACK)
+    print("  %-10s 줄 이동 %d바이트/회 + 새 줄 %d바이트 (세로 화면 전용)" % (
+        "하드웨어", cmd, spi.bytes // pushes))
+
+
+def _float_flight(grid, x, y, dx, dy, width):
+    # 예전 game.run_bubble_game 비행 루프 (float) - 비교용, 착지 칸 반환
+    R = grid.radius
+    while True:
+        x += dx
+        y += dy
+        if x <= R or x >= width - R:
+            dx = -dx
+            x += dx
+        if y <= R or grid.hit(x, y):
+            return grid.snap(x, y)
+
+
+def bench_shot_physics(shots=5000):
+    # 고정소수점 발사체가 float 버전과 같은 칸에 착지하는지 무작위 발사로 확인
+    import math
+    import random
+    from bubblegrid import Shot, velocity_table, FP_SHIFT
+    random.seed(3)
+    grid = BubbleGrid(15, 11, 7, 12, 5)
+    vx, vy = velocity_table(12, 20, 160, 5)
+    shot = Shot(grid, 160)
+    same_lut = same_raw = 0
+    t_float = t_fixed = 0.0
+    for n in range(shots):
+        if n % 50 == 0:
+            # 50발마다 새 보드: 위쪽 3~8줄을 듬성듬성 채움
+            grid.clear()
+            for r in range(random.randint(3, 8)):
+                for c in range(grid.cols):
+                    if random.random() < 0.8:
+                        grid.set(r, c, random.randint(1, 5))
+        k = random.randrange(len(vx))
+        rad = math.radians(20 + k * 5)
+
+        t0 = time.time()
+        raw = _float_flight(grid, 80, 125, math.cos(rad) * 12, -math.sin(rad) * 12, 160)
+        t_float += time.time() - t0
+        lut = _float_flight(grid, 80, 125, vx[k] / (1 << FP_SHIFT), vy[k] / (1 << FP_SHIFT), 160)
+
+        t0 = time.time()
+        shot.start(80, 125, vx[k], vy[k])
+        while shot.step():
+            pass
+        fixed = shot.snap()
+        t_fixed += time.time() - t0
+
+        same_lut += fixed == lut
+        same_raw += fixed == raw
+        # 착지한 칸을 채워서 다음 발사는 조금 다른 보드에서
+        if fixed[0] != -1:
+            grid.set(fixed[0], fixed[1], random.randint(1, 5))
+    print("버블 발사 물리 (무작위 %d발)" % shots)
+    print("  예전 cos/sin float과 착지 칸 일치  %d / %d" % (same_raw, shots))
+    print("  float %7.1f us/발   고정소수점 %7.1f us/발" % (
+        t_float * 1000000 / shots, t_fixed * 1000000 / shots))
+    check("착지 칸", same_lut == shots, "같은 속도표 float과 %d발 모두 일치" % shots,
+          "같은 속도표 float과 %d / %d발만 일치!" % (same_lut, shots))
+
+
+def _bfs_dist(rows, gx, gy):
+    # 확인용: 도착에서 BFS 거리
+    h = len(rows)
+    w = len(rows[0])
+    dist = {(gx, gy): 0}
+    q = [(gx, gy)]
+    for x, y in q:
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            n = (x + dx, y + dy)
+            if 0 <= n[0] < w and 0 <= n[1] < h and rows[n[1]][n[0]] != 1 and n not in dist:
+                dist[n] = dist[(x, y)] + 1
+                q.append(n)
+    return dist
+
+
+def bench_maze_generate(seeds=200):
+    # 미로 생성 시간 + 거리표가 BFS와 같은지, 시작에서 도착까지 갈 수 있는지
+    import mazegen
+    ok = 0
+    lengths = []
+    elapsed = 0.0
+    for seed in range(1, seeds + 1):
+        t0 = time.time()
+        rows, dist, length = mazegen.generate(seed)
+        elapsed += time.time() - t0
+        w = len(rows[0])
+        goal = start = None
+        for y in range(len(rows)):
+            for x in range(w):
+                if rows[y][x] == 3: goal = (x, y)
+                elif rows[y][x] == 2: start = (x, y)
+        ref = _bfs_dist(rows, goal[0], goal[1])
+        same = all(dist[y * w + x] == ref.get((x, y), mazegen.UNREACHED)
+                   for y in range(len(rows)) for x in range(w))
+        ok += same and ref.get(start) == length == max(ref.values())
+        lengths.append(length)
+    print("미로 생성 (시드 %d개)" % seeds)
+    check("거리표/풀이", ok == seeds, "%d개 모두 일치" % seeds, "%d / %d개만 일치!" % (ok, seeds))
+    print("  시작~도착 거리  최소 %d  평균 %d  최대 %d (타일)" % (
+        min(lengths), sum(lengths) // seeds, max(lengths)))
+    print("  생성 시간  %7.1f us/개" % (elapsed * 1000000 / seeds))
+
+
+def _old_draw_maze_map(tft, current_map):
+    # 예전 game.draw_maze_map (타일마다 fillrect) - 비교용
+    T = maze.TILE_SIZE
+    tft.fill(st7735.BLACK)
+    for y in range(maze.MAP_H):
+        for x in range(maze.MAP_W):
+            tile = current_map[y][x]
+            px = x * T
+            py = y * T
+            if tile == 1:
+                tft.fillrect(px, py, T, T, 0x8410)
+                tft.fillrect(px + 1, py + 1, T - 2, T - 2, 0xC618)
+            elif tile == 2:
+                tft.fillrect(px, py, T, T, st7735.BLUE)
+            elif tile == 3:
+                tft.fillrect(px, py, T, T, st7735.GREEN)
+
+
+def bench_maze_load(loads=20):
+    # 레벨 하나 그리는 데 드는 버스 비용과 시간 (가로 160 x 세로 132 화면 기준)
+    import random
+    random.seed(2)
+    current_map = [[random.choice((0, 1, 1)) for x in range(maze.MAP_W)] for y in range(maze.MAP_H)]
+    current_map[1][1] = 2
+    current_map[maze.MAP_H - 2][maze.MAP_W - 2] = 3
+
+    spi = FakeSPI()
+    tft = st7735.TFT(spi, FakePin(), FakePin(), FakePin(spi), st7735.PANEL_132x160)
+    tft.rotation(1)
+    view = maze.MazeRenderer(tft, st7735.BLACK, 0x8410, 0xC618, st7735.BLUE, st7735.GREEN)
+    level = levels.LevelPack(levels.pack([current_map])).level(0)
+    print("미로 레벨 로딩 (%d회 평균)" % loads)
+    for name, draw in (("타일별 fillrect", lambda: _old_draw_maze_map(tft, current_map)),
+                       ("아틀라스+줄 전송", lambda: view.draw(level))):
+        spi.reset()
+        t0 = time.time()
+        for _ in range(loads):
+            draw()
+        elapsed = time.time() - t0
+        print("  %-16s 트랜잭션 %4d  바이트 %6d  %7.2f ms/회" % (
+            name, spi.transactions // loads, spi.bytes // loads, elapsed * 1000 / loads))
+
+
+def bench_async_flush(frames=60):
+    # 프레임버퍼 flush: 메인 루프가 전송을 기다리는 시간 (동기 vs 전송 스레드)
+    # 전송 순서가 같은지(화면 결과가 같은지)도 함께 확인
+    import random
+    print("프레임버퍼 flush (%d프레임)" % frames)
+    logs = []
+    for name, pipelined in (("동기 flush", False), ("전송 스레드", True)):
+        spi = RecordSPI()
+        dc = FakePin()
+        spi.dc = dc
+        tft = st7735.TFT(spi, dc, FakePin(), FakePin())
+        tft.framebuffer()
+        if pipelined:
+            tft.async_flush()
+        random.seed(5)
+        waited = 0.0
+        for f in range(frames):
+            # 게임 한 프레임처럼 작은 사각형 몇 개 + 가끔 큰 영역
+            for _ in range(4):
+                tft.fillrect(random.randrange(120), random.randrange(150), 9, 9, random.getrandbits(16))
+            if f % 15 == 0:
+                tft.fillrect(0, 0, 128, 100, random.getrandbits(16))
+            t0 = time.time()
+            tft.flush()
+            waited += time.time() - t0
+        t0 = time.time()
+        tft.fence()
+        tail = time.time() - t0
+        tft.async_flush(False)
+        logs.append(spi.log)
+        print("  %-10s flush 대기 %7.2f ms/프레임  마지막 fence %6.2f ms" % (
+            name, waited * 1000 / frames, tail * 1000))
+    check("전송 내용", logs[0] == logs[1])
+
+
+class BouncePin(object):
+    # 버튼 검증용 입력 핀: level()로 레벨을 바꾸면 엣지마다 등록된 인터럽트 핸들러를 바로 부름
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self):
+        self._v = 1
+        self._handler = None
+
+    def value(self):
+        return self._v
+
+    def irq(self, handler=None, trigger=3):
+        self._handler = handler
+
+    def level(self, v):
+        if v != self._v:
+            self._v = v
+            self._handler(self)
+
+
+def bench_buttons():
+    # 버튼 디바운스/반복/링버퍼: 흔들리는 엣지를 가짜 시계에 맞춰 넣고 나온 이벤트 순서를 확인
+    import buttons
+    from buttons import PRESS, RELEASE, REPEAT, NONE
+    now = [0]
+    ticks_ms = buttons.ticks_ms
+    buttons.ticks_ms = lambda: now[0]
+    try:
+        pins = [BouncePin(), BouncePin()]
+        btn = buttons.Buttons(pins, debounce_ms=20, repeat_delay_ms=300, repeat_ms=80)
+        # (시각 ms, 버튼, 레벨): 0 = 눌림
+        edges = [
+            # 0번: 누를 때 5ms 흔들림 -> 1.5초 누름 -> 뗄 때 3ms 흔들림
+            (1000, 0, 0), (1002, 0, 1), (1004, 0, 0), (1007, 0, 1), (1009, 0, 0),
+            (2500, 0, 1), (2501, 0, 0), (2503, 0, 1),
+            # 1번: 짧게 눌렀다 디바운스 시간 안에 뗌 (뗀 엣지는 무시됨 -> 다음 get()에서 맞춤)
+            (3000, 1, 0), (3005, 1, 1),
+        ]
+        got = []
+        for t in range(0, 3100):
+            now[0] = t
+            while edges and edges[0][0] == t:
+                _, i, v = edges.pop(0)
+                pins[i].level(v)
+            ev = btn.get()
+            while ev != NONE:
+                got.append((t, ev))
+                ev = btn.get()
+        want = [(1000, PRESS | 0)]
+        want += [(t, REPEAT | 0) for t in range(1300, 2500, 80)]
+        want += [(2500, RELEASE | 0), (3000, PRESS | 1), (3020, RELEASE | 1)]
+        print("버튼 이벤트 (가짜 핀 + 가짜 시계)")
+        check("이벤트 순서", got == want)
+
+        # 아무도 꺼내지 않을 때: 링버퍼(32칸)에 31개까지 순서대로 남고 나머지는 버림
+        t = 4000
+        for k in range(20):
+            for v in (0, 1):
+                now[0] = t
+                pins[1].level(v)
+                t += 30
+        now[0] = t
+        got = []
+        ev = btn.get()
+        while ev != NONE:
+            got.append(ev)
+            ev = btn.get()
+        want = [(RELEASE if k & 1 else PRESS) | 1 for k in range(31)]
+        check("링버퍼", got == want)
+
+        # clear(): 쌓인 이벤트를 버림
+        now[0] = t + 30
+        pins[0].level(0)
+        btn.clear()
+        check("clear", btn.get() == NONE and btn.is_down(0))
+    finally:
+        buttons.ticks_ms = ticks_ms
+
+
+def run():
+    # 모든 벤치를 돌린 뒤 검증이 하나라도 틀렸으면 AssertionError
+    del _failed[:]
+    bench_fillrect_transactions()
+    bench_fillrect_alloc()
+    bench_grid_collision()
+    bench_bubble_matches()
+    bench_shot_physics()
+    bench_maze_load()
+    bench_maze_generate()
+    bench_text()
+    bench_bubble_sprites()
+    bench_bubble_push()
+    bench_async_flush()
+    bench_buttons()
+    if _failed:
+        raise AssertionError("검증 실패: " + ", ".join(_failed))
+
+
+if __name__ == "__main__":
+    try:
+        run()
+    except AssertionError as e:
+        print(e)
+        sys.exit(1)
@@ -0,0 +1,299 @@
+# bubblegrid.py
+# 버블 슈터 격자 (화면/하드웨어와 무관해서 PC에서도 import 가능)
+# 홀수 줄이 반 칸(radius) 오른쪽으로 밀린 육각 배치 (push_row 할 때마다 짝/홀이 바뀜: parity)
+# 칸 값은 색 번호: 0 = 빈 칸, 1..ncolors = 팔레트 색
+import math
+
+# 발사체 좌표/속도 고정소수점 (1/256 픽셀)
+# 거리 제곱이 MicroPython small int(30비트) 안에 들어가도록 8비트만 씀
+FP_SHIFT = 8
+
+# 육각 이웃 (줄 변화, 칸 변화): 안 밀린 줄은 위아래 줄의 c-1, c / 반 칸 밀린 줄은 c, c+1
+_NB_EVEN = ((-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0))
+_NB_ODD = ((-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1))
+
+
+class BubbleGrid(object):
+    def __init__(self, rows, cols, radius, row_height, ncolors, margin=2):
+        self.rows = rows
+        self.cols = cols
+        self.radius = radius
+        self.dia = radius * 2
+        self.row_height = row_height
+        self._x0 = radius + margin
+        self._y0 = radius + margin
+
+        # 칸 저장: 1칸 1바이트 평면 배열 (인덱스 = r * cols + c)
+        self.cells = bytearray(rows * cols)
+        # 차 있는 칸 수 / 색별 개수 (set 할 때 같이 갱신 -> 전체 스캔 불필요)
+        self.count = 0
+        self.color_counts = [0] * (ncolors + 1)
+
+        # 모든 칸의 중심 좌표를 한 번만 계산 (x는 parity 0/1 두 벌, 줄을 밀 때 바꿔 끼움)
+        # parity = 1이면 짝수 줄이 반 칸 밀린 줄 (맨 위에 줄을 넣어도 기존 버블 x 좌표는 그대로)
+        self.parity = 0
+        self._cx = ([], [])
+        self.cy = []
+        for r in range(rows):
+            for p in (0, 1):
+                offset = radius if (r + p) % 2 == 1 else 0
+                for c in range(cols):
+                    self._cx[p].append(c * self.dia + self._x0 + offset)
+            for c in range(cols):
+                self.cy.append(r * row_height + self._y0)
+        self.cx = self._cx[0]
+
+        # 충돌 거리 / 착지 허용 거리(지름 1.5배), 제곱으로 비교해서 sqrt를 쓰지 않음
+        self._hit_d = self.dia - 1
+        self._hit_d2 = self._hit_d ** 2
+        self._snap_d = self.dia * 3 // 2
+        self._snap_d2 = self._snap_d ** 2
+
+        # 탐색용 방문 표시 (호출마다 set/list를 새로 만들지 않도록 스탬프 방식)
+        self._mark = bytearray(rows * cols)
+        self._stamp = 0
+        self._stack = []
+
+    # ------------------------------------------
+    # 칸 읽기/쓰기
+    # ------------------------------------------
+    def get(self, r, c):
+        return self.cells[r * self.cols + c]
+
+    def set(self, r, c, v):
+        self.set_index(r * self.cols + c, v)
+
+    def set_index(self, i, v):
+        old = self.cells[i]
+        if old == v:
+            return
+        if old:
+            self.count -= 1
+            self.color_counts[old] -= 1
+        if v:
+            self.count += 1
+            self.color_counts[v] += 1
+        self.cells[i] = v
+
+    def clear(self):
+        for i in range(len(self.cells)):
+            self.cells[i] = 0
+        self.count = 0
+        for v in range(len(self.color_counts)):
+            self.color_counts[v] = 0
+        self.parity = 0
+        self.cx = self._cx[0]
+
+    def push_row(self, values):
+        # 모든 줄을 한 줄 아래로 내리고 맨 위에 values(칸별 색 번호) 줄을 넣음
+        # 맨 아랫줄 버블은 버려짐 (그 전에 lowest_row()로 게임 오버를 확인)
+        cols = self.cols
+        cells = self.cells
+        n = len(cells)
+        for i in range(n - cols, n):
+            self.set_index(i, 0)
+        # 아래 줄부터 한 줄씩 복사 (겹치는 영역을 한 번에 옮기지 않음)
+        for o in range(n - cols, 0, -cols):
+            cells[o:o + cols] = cells[o - cols:o]
+        for c in range(cols):
+            cells[c] = 0
+            self.set_index(c, values[c])
+        self.parity ^= 1
+        self.cx = self._cx[self.parity]
+
+    def lowest_row(self):
+        # 버블이 있는 가장 아래 줄 (비어 있으면 -1)
+        cells = self.cells
+        for i in range(len(cells) - 1, -1, -1):
+            if cells[i]:
+                return i // self.cols
+        return -1
+
+    def coords(self, r, c):
+        i = r * self.cols + c
+        return self.cx[i], self.cy[i]
+
+    # ------------------------------------------
+    # 충돌 / 착지
+    # ------------------------------------------
+    def _nearest(self, bx, by, d, d2, empty, sh=0):
+        # (bx, by)에서 d 안에 들어올 수 있는 줄/칸만 검사 (격자 크기와 무관하게 몇 칸뿐)
+        # empty=False: 차 있는 칸 중 d 안에 있는 첫 칸 / empty=True: d 안의 가장 가까운 빈 칸
+        # sh: 좌표가 고정소수점이면 소수 비트 수 (격자 상수를 같은 단위로 맞춰서 정수로만 계산)
+        cells = self.cells
+        cx = self.cx
+        cy = self.cy
+        rh = self.row_height << sh
+        dia = self.dia << sh
+        x0 = self._x0 << sh
+        y0 = self._y0 << sh
+        d <<= sh
+        best_d2 = d2 << (sh * 2)
+        best_r, best_c = -1, -1
+        parity = self.parity
+        r_lo = int((by - y0 - d) // rh)
+        r_hi = int((by - y0 + d) // rh)
+        if r_lo < 0: r_lo = 0
+        if r_hi >= self.rows: r_hi = self.rows - 1
+        for r in range(r_lo, r_hi + 1):
+            offset = self.radius << sh if (r + parity) % 2 == 1 else 0
+            c_lo = int((bx - x0 - offset - d) // dia)
+            c_hi = int((bx - x0 - offset + d) // dia)
+            if c_lo < 0: c_lo = 0
+            if c_hi >= self.cols: c_hi = self.cols - 1
+            for c in range(c_lo, c_hi + 1):
+                i = r * self.cols + c
+                if (cells[i] == 0) != empty:
+                    continue
+                ddx = bx - (cx[i] << sh)
+                ddy = by - (cy[i] << sh)
+                dd = ddx * ddx + ddy * ddy
+                if dd < best_d2:
+                    if not empty:
+                        return r, c
+                    best_d2 = dd
+                    best_r, best_c = r, c
+        return best_r, best_c
+
+    def hit(self, bx, by):
+        # 날아가는 버블이 주변의 차 있는 칸과 닿았는지
+        return self._nearest(bx, by, self._hit_d, self._hit_d2, False)[0] != -1
+
+    def snap(self, bx, by):
+        # 착지할 빈 칸 (없으면 -1, -1)
+        return self._nearest(bx, by, self._snap_d, self._snap_d2, True)
+
+    def hit_fp(self, fx, fy):
+        # hit()의 고정소수점 좌표 버전 (정수 연산만)
+        return self._nearest(fx, fy, self._hit_d, self._hit_d2, False, FP_SHIFT)[0] != -1
+
+    def snap_fp(self, fx, fy):
+        return self._nearest(fx, fy, self._snap_d, self._snap_d2, True, FP_SHIFT)
+
+    # ------------------------------------------
+    # 같은 색 묶음 / 천장에서 떨어진 묶음 찾기 (재귀 없이 스택으로)
+    # 결과는 평면 인덱스 리스트
+    # ------------------------------------------
+    def _new_stamp(self):
+        self._stamp += 1
+        if self._stamp > 255:
+            for i in range(len(self._mark)):
+                self._mark[i] = 0
+            self._stamp = 1
+        return self._stamp
+
+    def _flood(self, starts, color, out):
+        # starts에서 출발해 color와 같은 칸(color=0이면 차 있는 모든 칸)을 out에 모음
+        cells = self.cells
+        stamp = self._stamp
+        mark = self._mark
+        stack = self._stack
+        cols = self.cols
+        rows = self.rows
+        parity = self.parity
+        for i in starts:
+            if mark[i] != stamp:
+                mark[i] = stamp
+                stack.append(i)
+        while stack:
+            i = stack.pop()
+            out.append(i)
+            r = i // cols
+            c = i - r * cols
+            for dr, dc in (_NB_ODD if (r + parity) % 2 == 1 else _NB_EVEN):
+                nr = r + dr
+                nc = c + dc
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    j = nr * cols + nc
+                    if mark[j] != stamp:
+                        v = cells[j]
+                        if v != 0 and (color == 0 or v == color):
+                            mark[j] = stamp
+                            stack.append(j)
+        return out
+
+    def matches(self, r, c):
+        # (r, c)와 이어진 같은 색 칸들
+        i = r * self.cols + c
+        color = self.cells[i]
+        if color == 0:
+            return []
+        self._new_stamp()
+        return self._flood((i,), color, [])
+
+    def floating(self):
+        # 맨 윗줄과 이어지지 않은(떠 있는) 칸들
+        cells = self.cells
+        self._new_stamp()
+        top = [c for c in range(self.cols) if cells[c] != 0]
+        self._flood(top, 0, [])
+        stamp = self._stamp
+        mark = self._mark
+        return [i for i in range(len(cells)) if cells[i] != 0 and mark[i] != stamp]
+
+    def pop(self, r, c, min_count=3):
+        # (r, c)에 붙은 같은 색이 min_count개 이상이면 지우고, 그 때문에 떠버린 묶음도 함께 지움
+        # 반환: (지운 같은 색 칸, 떨어진 칸) 평면 인덱스 리스트
+        matched = self.matches(r, c)
+        if len(matched) < min_count:
+            return [], []
+        for i in matched:
+            self.set_index(i, 0)
+        dropped = self.floating()
+        for i in dropped:
+            self.set_index(i, 0)
+        return matched, dropped
+
+
+def velocity_table(speed, a_min, a_max, step):
+    # 발사 각도(도)별 속도 벡터 (고정소수점, 화면 좌표라 위쪽이 -y)
+    # 인덱스 = (각도 - a_min) // step
+    vx = []
+    vy = []
+    for a in range(a_min, a_max + 1, step):
+        rad = math.radians(a)
+        vx.append(int(round(math.cos(rad) * speed * (1 << FP_SHIFT))))
+        vy.append(-int(round(math.sin(rad) * speed * (1 << FP_SHIFT))))
+    return vx, vy
+
+
+class Shot(object):
+    # 날아가는 버블: 좌표/속도 모두 고정소수점 정수 (비행 중 float 할당 없음)
+    def __init__(self, grid, width):
+        self.grid = grid
+        r = grid.radius << FP_SHIFT
+        self._left = r
+        self._right = (width << FP_SHIFT) - r
+        self._top = r
+        self.fx = self.fy = self.vx = self.vy = 0
+        self.moving = False
+
+    def start(self, x, y, vx, vy):
+        # x, y: 픽셀 / vx, vy: velocity_table 값
+        self.fx = x << FP_SHIFT
+        self.fy = y << FP_SHIFT
+        self.vx = vx
+        self.vy = vy
+        self.moving = True
+
+    def step(self):
+        # 한 프레임 이동: 좌우 벽에서 반사, 천장이나 버블에 닿으면 멈춤
+        fx = self.fx + self.vx
+        fy = self.fy + self.vy
+        if fx <= self._left or fx >= self._right:
+            self.vx = -self.vx
+            fx += self.vx
+        self.fx = fx
+        self.fy = fy
+        if fy <= self._top or self.grid.hit_fp(fx, fy):
+            self.moving = False
+        return self.moving
+
+    def x(self):
+        return self.fx >> FP_SHIFT
+
+    def y(self):
+        return self.fy >> FP_SHIFT
+
+    def snap(self):
+        return self.grid.snap_fp(self.fx, self.fy)
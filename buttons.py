@@ -0,0 +1,114 @@
+# buttons.py
+# 버튼 입력: 핀 인터럽트 + 시간 기반 디바운스 + 이벤트 링버퍼
+# 게임 루프는 버튼을 직접 폴링하지 않고 get()/wait()로 이벤트를 꺼내 씀
+#
+# 이벤트 값 = 종류 | 버튼 번호  (예: PRESS | 2)
+#   버튼 번호는 Buttons에 넘긴 핀 리스트의 순서 (최대 16개)
+from clock import ticks_ms, ticks_diff, ticks_add, idle
+
+try:
+    from machine import disable_irq, enable_irq
+except ImportError:
+    def disable_irq():
+        return 0
+
+    def enable_irq(state):
+        pass
+
+PRESS = 0x10
+RELEASE = 0x20
+REPEAT = 0x30
+NONE = -1
+
+
+class Buttons(object):
+    def __init__(self, pins, debounce_ms=20, repeat_delay_ms=300, repeat_ms=80, size=32):
+        # pins: 풀업 입력 핀 리스트 (눌리면 0)
+        self._pins = pins
+        self.debounce_ms = debounce_ms
+        self.repeat_delay_ms = repeat_delay_ms
+        self.repeat_ms = repeat_ms
+
+        n = len(pins)
+        self._down = bytearray(n)       # 디바운스된 눌림 상태
+        self._changed = [0] * n          # 마지막으로 상태가 바뀐 시각
+        self._repeat_at = [0] * n        # 다음 반복 이벤트 시각
+
+        # 링버퍼 (크기는 2의 거듭제곱)
+        self._buf = bytearray(size)
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+
+        now = ticks_ms()
+        for i in range(n):
+            p = pins[i]
+            self._down[i] = 1 if p.value() == 0 else 0
+            self._changed[i] = now
+            p.irq(handler=self._make_handler(i), trigger=p.IRQ_FALLING | p.IRQ_RISING)
+
+    def _make_handler(self, i):
+        def handler(pin):
+            self._edge(i, ticks_ms())
+        return handler
+
+    def _edge(self, i, now):
+        # 인터럽트에서 호출: 디바운스 시간 안의 흔들림은 무시
+        if ticks_diff(now, self._changed[i]) < self.debounce_ms:
+            return
+        down = 1 if self._pins[i].value() == 0 else 0
+        if down == self._down[i]:
+            return
+        self._down[i] = down
+        self._changed[i] = now
+        if down:
+            self._repeat_at[i] = ticks_add(now, self.repeat_delay_ms)
+            self._push(PRESS | i)
+        else:
+            self._push(RELEASE | i)
+
+    def _push(self, ev):
+        nxt = (self._head + 1) & self._mask
+        if nxt == self._tail:
+            return  # 가득 차면 새 이벤트는 버림
+        self._buf[self._head] = ev
+        self._head = nxt
+
+    def _update(self):
+        # 디바운스 시간 안에 바뀐 최종 상태(인터럽트를 놓친 경우 포함)를 맞추고 반복 이벤트 생성
+        # (인터럽트 핸들러와 링버퍼를 같이 건드리므로 잠깐 인터럽트를 막음)
+        now = ticks_ms()
+        state = disable_irq()
+        for i in range(len(self._pins)):
+            self._edge(i, now)
+            if self._down[i] and ticks_diff(now, self._repeat_at[i]) >= 0:
+                self._repeat_at[i] = ticks_add(self._repeat_at[i], self.repeat_ms)
+                self._push(REPEAT | i)
+        enable_irq(state)
+
+    def get(self):
+        # 이벤트 하나 꺼내기 (없으면 NONE)
+        if self._head == self._tail:
+            self._update()
+            if self._head == self._tail:
+                return NONE
+        ev = self._buf[self._tail]
+        self._tail = (self._tail + 1) & self._mask
+        return ev
+
+    def wait(self, timeout_ms):
+        # 이벤트가 올 때까지(최대 timeout_ms) CPU를 쉬면서 기다림
+        start = ticks_ms()
+        while True:
+            ev = self.get()
+            if ev != NONE or ticks_diff(ticks_ms(), start) >= timeout_ms:
+                return ev
+            idle()
+
+    def is_down(self, i):
+        return self._down[i] == 1
+
+    def clear(self):
+        # 쌓인 이벤트를 버림 (화면을 바꿀 때 이전 화면의 입력이 넘어오지 않도록)
+        self._update()
+        self._tail = self._head
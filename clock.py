@@ -0,0 +1,33 @@
+# clock.py
+# 밀리초/마이크로초 타이머 함수
+# 보드에서는 MicroPython time 모듈 함수를 그대로 쓰고, PC(CPython)에서는 같은 동작으로 대신 구현
+import time
+
+try:
+    from time import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_ms
+except ImportError:
+    # MicroPython과 같은 30비트 순환 카운터
+    _MASK = (1 << 30) - 1
+    _HALF = 1 << 29
+
+    def ticks_ms():
+        return int(time.monotonic() * 1000) & _MASK
+
+    def ticks_us():
+        return int(time.monotonic() * 1000000) & _MASK
+
+    def ticks_add(t, delta):
+        return (t + delta) & _MASK
+
+    def ticks_diff(a, b):
+        return ((a - b + _HALF) & _MASK) - _HALF
+
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+try:
+    # 다음 인터럽트(틱)까지 CPU를 쉬게 함
+    from machine import idle
+except ImportError:
+    def idle():
+        sleep_ms(1)
@@ -1,62 +1,23 @@
-from machine import Pin, SPI
+from machine import Pin, SPI, reset_cause, SOFT_RESET
 import time
 import math
 import random
+from bubblegrid import BubbleGrid, Shot, velocity_table
+from maze import MazeRenderer, TILE_SIZE
+from levels import LevelPack, BUILTIN as BUILTIN_LEVELS
+import mazegen
+from buttons import Buttons, PRESS, RELEASE
+from scheduler import FrameScheduler
+from clock import ticks_ms, ticks_diff, ticks_add
+from mazephys import MazePhysics
+from sprites import BubbleSprites
+from menu import Menu
+from st7735 import TFT, PANEL_132x160
 
 # ==========================================
-# 1. TFT 드라이버 (변경 없음)
+# 1. TFT 드라이버 (st7735.py 하나로 통합)
 # ==========================================
-class TFT(object):
-    def __init__(self, spi, aDC, aReset, aCS):
-        self._spi = spi
-        self._dc = aDC
-        self._reset = aReset
-        self._cs = aCS
-        self._cs.value(1)
-        self._dc.value(0)
-        self._reset.value(1)
-        self.width_limit = 160 
-        self.height_limit = 132
-        self.colstart = 0 
-        self.rowstart = 0
-
-    def _write(self, aData):
-        self._spi.write(aData)
-    def _writeCmd(self, aCmd):
-        self._dc.value(0); self._cs.value(0); self._write(bytearray([aCmd])); self._cs.value(1)
-    def _writeData(self, aData):
-        self._dc.value(1); self._cs.value(0); self._write(bytearray([aData])); self._cs.value(1)
-    def _writeBlock(self, aData):
-        self._dc.value(1); self._cs.value(0); self._write(aData); self._cs.value(1)
-    def initr(self):
-        self._reset.value(0); time.sleep_ms(50)
-        self._reset.value(1); time.sleep_ms(50)
-        self._writeCmd(0x01); time.sleep_ms(150)
-        self._writeCmd(0x11); time.sleep_ms(255)
-        self._writeCmd(0x3A); self._writeData(0x05)
-        self._writeCmd(0x36); self._writeData(0xC0)
-        self._writeCmd(0x13); time.sleep_ms(10)
-        self._writeCmd(0x29); time.sleep_ms(100)
-    def _set_window(self, x0, y0, x1, y1):
-        x0+=self.colstart; x1+=self.colstart; y0+=self.rowstart; y1+=self.rowstart
-        self._writeCmd(0x2A); self._writeData(x0>>8); self._writeData(x0&0xFF); self._writeData(x1>>8); self._writeData(x1&0xFF)
-        self._writeCmd(0x2B); self._writeData(y0>>8); self._writeData(y0&0xFF); self._writeData(y1>>8); self._writeData(y1&0xFF)
-        self._writeCmd(0x2C)
-    def fillrect(self, x, y, w, h, color):
-        if x>=self.width_limit or y>=self.height_limit: return
-        if x+w>self.width_limit: w=self.width_limit-x
-        if y+h>self.height_limit: h=self.height_limit-y
-        self._set_window(x, y, x+w-1, y+h-1)
-        high=color>>8; low=color&0xFF
-        chunk=1024; buffer=bytearray([high, low]*chunk); total=w*h
-        for i in range(0, total, chunk):
-            p=min(chunk, total-i)
-            if p<chunk: self._writeBlock(bytearray([high, low]*p))
-            else: self._writeBlock(buffer)
-    def fill(self, color): self.fillrect(0, 0, self.width_limit, self.height_limit, color)
-    def rotation(self, m):
-        self._writeCmd(0x36)
-        if m==1: self._writeData(0xA0); self.width_limit=160; self.height_limit=132
+# 게임 화면: 132x160 패널을 가로(회전 1)로 돌려서 160x132로 씀
 
 # ==========================================
 # 2. 하드웨어 설정 (핀 매핑 수정됨)
@@ -66,10 +27,29 @@ dc_pin = Pin(2, Pin.OUT)
 reset_pin = Pin(4, Pin.OUT)
 cs_pin = Pin(5, Pin.OUT)
 
-tft = TFT(spi, dc_pin, reset_pin, cs_pin)
-tft.initr()
+tft = TFT(spi, dc_pin, reset_pin, cs_pin, PANEL_132x160)
+# 소프트 리셋(Ctrl-D 등)이면 패널은 이미 켜져 있으므로 리셋/슬립 해제 대기를 건너뜀
+tft.initr(warm=reset_cause() == SOFT_RESET)
 tft.rotation(1)
 
+# 백버퍼(약 42KB)에 그리고 바뀐 영역만 전송 -> SPI 전송량 감소, 지웠다 그리는 깜빡임 제거
+# 메모리가 부족하면 False로 두면 예전처럼 화면에 바로 그림
+USE_FRAMEBUFFER = True
+if USE_FRAMEBUFFER:
+    tft.framebuffer()
+
+# flush()가 SPI 전송을 기다리지 않고 전송 스레드에 넘김 (전송 중에 다음 프레임 계산)
+# _thread가 없는 펌웨어면 False
+ASYNC_FLUSH = True
+if USE_FRAMEBUFFER and ASYNC_FLUSH:
+    tft.async_flush()
+
+# PROFILE_SPI = True 이면 SPI 전송(창 설정/바이트/시간)을 구간 태그(tft.section)별로 모아서
+# 게임을 나갈 때 시리얼로 출력 (프로파일 중에는 비동기 flush가 꺼짐)
+PROFILE_SPI = False
+if PROFILE_SPI:
+    tft.profile()
+
 # [수정됨] 핀 번호를 변수명으로 사용하여 헷갈리지 않게 정의
 btn_27 = Pin(27, Pin.IN, Pin.PULL_UP) # 메인:위 / 버블:오른쪽
 btn_14 = Pin(14, Pin.IN, Pin.PULL_UP) # 메인:아래 / 버블:왼쪽
@@ -80,6 +60,10 @@ btn_33 = Pin(33, Pin.IN, Pin.PULL_UP) # 미로:왼쪽
 btn_25 = Pin(25, Pin.IN, Pin.PULL_UP) # 미로:오른쪽
 btn_26 = Pin(26, Pin.IN, Pin.PULL_UP) # 미로:아래
 
+# 버튼은 인터럽트로 받아서 디바운스 후 이벤트 큐에 쌓음 (아래 번호 = 이벤트의 버튼 번호)
+BTN_27, BTN_14, BTN_12, BTN_32, BTN_33, BTN_25, BTN_26 = range(7)
+buttons = Buttons([btn_27, btn_14, btn_12, btn_32, btn_33, btn_25, btn_26])
+
 # 색상 정의
 BLACK   = 0x0000
 BLUE    = 0x001F
@@ -92,167 +76,133 @@ WHITE   = 0xFFFF
 GRAY    = 0x8410
 
 COLORS = [RED, GREEN, BLUE, YELLOW, MAGENTA, CYAN]
+# 버블 격자는 색 번호를 저장: PALETTE[번호] = 실제 색 (0 = 빈 칸)
+PALETTE = [BLACK] + COLORS
+
+# 고정 주기 프레임 (그리는 데 걸린 시간을 빼고 남은 시간만 잠)
+# SHOW_FRAME_STATS = True 이면 게임을 나갈 때 프레임 시간 통계를 시리얼로 출력
+# (ASYNC_FLUSH면 spi 항목은 전송 버퍼로 복사하는 시간만, 실제 전송 시간은 PROFILE_SPI로)
+MAZE_FRAME_MS = 20
+FLIGHT_FRAME_MS = 16
+SHOW_FRAME_STATS = False
+maze_clock = FrameScheduler(MAZE_FRAME_MS)
+flight_clock = FrameScheduler(FLIGHT_FRAME_MS)
 
 # ==========================================
 # 3. 게임 1: 미로 찾기 (버튼 로직 수정됨)
 # ==========================================
-TILE_SIZE = 11
-MAP_W = 14
-MAP_H = 11
-
-MAP_LEVEL_1 = [
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1],
-    [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1],
-    [1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1],
-    [1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1],
-    [1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1],
-    [1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1],
-    [1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 0, 1],
-    [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1],
-    [1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1],
-    [1, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-]
-MAP_LEVEL_2 = [
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-    [1, 2, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1],
-    [1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1],
-    [1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1],
-    [1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1],
-    [1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1],
-    [1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1],
-    [1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1],
-    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 3, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-]
-MAP_LEVEL_3 = [
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-    [1, 3, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1],
-    [1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1],
-    [1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1],
-    [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1],
-    [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1],
-    [1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1],
-    [1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1],
-    [1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1],
-    [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-]
-ALL_LEVELS = [MAP_LEVEL_1, MAP_LEVEL_2, MAP_LEVEL_3]
-
-def draw_maze_map(current_map):
-    tft.fill(BLACK)
-    for y in range(MAP_H):
-        for x in range(MAP_W):
-            tile = current_map[y][x]
-            px = x * TILE_SIZE
-            py = y * TILE_SIZE
-            if tile == 1:
-                tft.fillrect(px, py, TILE_SIZE, TILE_SIZE, GRAY)
-                tft.fillrect(px+1, py+1, TILE_SIZE-2, TILE_SIZE-2, 0xC618)
-            elif tile == 2:
-                tft.fillrect(px, py, TILE_SIZE, TILE_SIZE, BLUE)
-            elif tile == 3:
-                tft.fillrect(px, py, TILE_SIZE, TILE_SIZE, GREEN)
+# 레벨은 타일 2비트로 묶은 bytes (levels.py) - 한 레벨씩 꺼내 씀
+# 파일로 넣었으면 LevelPack("levels.bin") 처럼 파일 이름을 주면 레코드만 읽음
+maze_levels = LevelPack(BUILTIN_LEVELS)
+# 기본 레벨 다음에 이어서 나오는 자동 생성 미로 수 (레벨 사이에 바로 만듦)
+# 보드에서 걸리는 생성 시간은 import bench; bench.bench_maze_generate() 로 확인
+GENERATED_LEVELS = 3
+
+# 벽 충돌: 줄마다 벽 비트마스크, 가로/세로 따로 처리 (벽을 따라 미끄러짐)
+maze_phys = MazePhysics(160, 132)
+# 벽에 부딪히면 이 시간 동안 플레이어를 빨간색으로 (기다리지 않고 계속 입력을 받음)
+WALL_FLASH_MS = 150
+
+# 벽 타일을 미리 그려둔 아틀라스로 맵을 줄 단위로 전송 (타일마다 fillrect 하지 않음)
+maze_view = MazeRenderer(tft, BLACK, GRAY, 0xC618, BLUE, GREEN)
+
+def draw_maze_map(level):
+    with tft.section("maze map"):
+        maze_view.draw(level, BLACK)
+        tft.flush()
 
 def run_maze_game():
+    buttons.clear()
     current_level = 0
-    max_level = len(ALL_LEVELS)
+    max_level = len(maze_levels) + GENERATED_LEVELS
     
     while current_level < max_level:
-        current_map = ALL_LEVELS[current_level]
-        draw_maze_map(current_map)
+        if current_level < len(maze_levels):
+            level = maze_levels.level(current_level)
+        else:
+            level = mazegen.level(random.getrandbits(16))
+        draw_maze_map(level)
+        maze_phys.load(level)
         
-        # 시작 위치 찾기
-        start_x, start_y = 10, 10
-        for y in range(MAP_H):
-            for x in range(MAP_W):
-                if current_map[y][x] == 2:
-                    start_x = x * TILE_SIZE + 2
-                    start_y = y * TILE_SIZE + 2
+        # 시작 위치는 레벨 머리에 들어 있음
+        start_x = level.start[0] * TILE_SIZE + 2
+        start_y = level.start[1] * TILE_SIZE + 2
         
         px, py = start_x, start_y
         pw, ph = 7, 7
         tft.fillrect(px, py, pw, ph, WHITE)
+        tft.flush()
         
         level_cleared = False
+        flash_end = None    # 벽에 부딪힌 표시가 끝나는 시각 (None이면 표시 없음)
         
         while not level_cleared:
             # [기능 추가] 12번 누르면 메인으로 복귀
-            if btn_12.value() == 0:
-                return
+            ev = buttons.get()
+            while ev >= 0:
+                if ev == PRESS | BTN_12:
+                    return
+                ev = buttons.get()
 
             dx, dy = 0, 0
             speed = 2
             
             # [수정됨] 미로 게임 키 매핑
-            # 32:위, 33:왼쪽, 25:오른쪽, 26:아래
-            if btn_32.value() == 0: dy = -speed # 위
-            if btn_26.value() == 0: dy = speed  # 아래
-            if btn_33.value() == 0: dx = -speed # 왼쪽
-            if btn_25.value() == 0: dx = speed  # 오른쪽
+            # 32:위, 33:왼쪽, 25:오른쪽, 26:아래 (누르고 있는 동안 이동)
+            if buttons.is_down(BTN_32): dy = -speed # 위
+            if buttons.is_down(BTN_26): dy = speed  # 아래
+            if buttons.is_down(BTN_33): dx = -speed # 왼쪽
+            if buttons.is_down(BTN_25): dx = speed  # 오른쪽
             
             if dx == 0 and dy == 0:
-                time.sleep(0.01)
+                # 벽 표시 시간이 지났으면 원래 색으로
+                if flash_end is not None and ticks_diff(ticks_ms(), flash_end) >= 0:
+                    flash_end = None
+                    tft.fillrect(px, py, pw, ph, WHITE); tft.flush()
+                # 다음 버튼 이벤트까지 대기 (이동은 눌림 상태로 보므로 나가기만 확인)
+                ev = buttons.wait(50)
+                if ev == PRESS | BTN_12:
+                    return
                 continue
 
-            new_x = px + dx
-            new_y = py + dy
-            
-            if new_x < 0: new_x = 0
-            if new_x > 160 - pw: new_x = 160 - pw 
-            if new_y < 0: new_y = 0
-            if new_y > 132 - ph: new_y = 132 - ph
-            
-            hit_wall = False
-            reached_goal = False
-            corners = [(new_x, new_y), (new_x+pw-1, new_y), (new_x, new_y+ph-1), (new_x+pw-1, new_y+ph-1)]
-            
-            for cx, cy in corners:
-                tx = int(cx // TILE_SIZE)
-                ty = int(cy // TILE_SIZE)
-                if 0 <= tx < MAP_W and 0 <= ty < MAP_H:
-                    tile = current_map[ty][tx]
-                    if tile == 1: hit_wall = True
-                    elif tile == 3: reached_goal = True
-            
-            if hit_wall:
-                for _ in range(3):
-                    tft.fillrect(px, py, pw, ph, RED)
-                    time.sleep(0.05)
-                    tft.fillrect(px, py, pw, ph, BLACK)
-                    time.sleep(0.05)
-                
-                tft.fillrect(px, py, pw, ph, BLACK)
-                px, py = start_x, start_y
-                tft.fillrect(px, py, pw, ph, WHITE)
-                time.sleep(0.3)
-                continue 
+            maze_clock.begin()
+            # 막힌 축만 벽 앞에서 멈추고 나머지 축은 그대로 이동
+            new_x, new_y, hit_wall = maze_phys.move(px, py, pw, ph, dx, dy)
                 
-            if reached_goal:
+            if maze_phys.at_goal(new_x, new_y, pw, ph):
                 level_cleared = True
-                tft.fill(GREEN)
+                tft.fill(GREEN); tft.flush()
                 time.sleep(0.5)
                 break
+            
+            old_color = RED if flash_end is not None else WHITE
+            if hit_wall:
+                flash_end = ticks_add(ticks_ms(), WALL_FLASH_MS)
+            elif flash_end is not None and ticks_diff(ticks_ms(), flash_end) >= 0:
+                flash_end = None
+            color = RED if flash_end is not None else WHITE
                 
-            if new_x != px or new_y != py:
-                tft.fillrect(px, py, pw, ph, BLACK)
-                sx, sy = start_x, start_y
-                if abs(px - sx) < 11 and abs(py - sy) < 11:
-                      tft.fillrect(int(sx//TILE_SIZE)*TILE_SIZE, int(sy//TILE_SIZE)*TILE_SIZE, TILE_SIZE, TILE_SIZE, BLUE)
+            maze_clock.rendering()
+            with tft.section("maze move"):
+                if new_x != px or new_y != py:
+                    tft.fillrect(px, py, pw, ph, BLACK)
+                    sx, sy = start_x, start_y
+                    if abs(px - sx) < 11 and abs(py - sy) < 11:
+                          tft.fillrect(sx//TILE_SIZE*TILE_SIZE, sy//TILE_SIZE*TILE_SIZE, TILE_SIZE, TILE_SIZE, BLUE)
                 
-                px, py = new_x, new_y
-                tft.fillrect(px, py, pw, ph, WHITE)
+                    px, py = new_x, new_y
+                    tft.fillrect(px, py, pw, ph, color)
+                elif color != old_color:
+                    tft.fillrect(px, py, pw, ph, color)
             
-            time.sleep(0.02)
+                maze_clock.end(tft.flush)
             
         current_level += 1
         
     tft.fill(BLACK)
     for _ in range(3):
-        tft.fill(YELLOW); time.sleep(0.2)
-        tft.fill(RED); time.sleep(0.2)
+        tft.fill(YELLOW); tft.flush(); time.sleep(0.2)
+        tft.fill(RED); tft.flush(); time.sleep(0.2)
     return
 
 # ==========================================
@@ -264,223 +214,279 @@ DRAW_RADIUS = 5
 COLS = 160 // GRID_DIA  
 ROWS = 15
 ROW_HEIGHT = int(GRID_DIA * 0.90) 
-bubble_grid = []
+# 칸마다 1바이트 + 전체/색별 개수를 같이 관리하는 격자 (칸 중심 좌표도 미리 계산)
+bubble_grid = BubbleGrid(ROWS, COLS, GRID_RADIUS, ROW_HEIGHT, len(COLORS))
+# 격자 버블은 색별로 미리 그려둔 스프라이트를 blit (버블 하나 = 창 1번)
+bubble_sprites = BubbleSprites(tft, DRAW_RADIUS, PALETTE, BLACK, WHITE)
+
+# PUSH_SHOTS발마다 맨 위에 새 줄이 들어오고 보드가 한 줄씩 내려옴
+# 보드 영역은 조준 영역(y 105~) 위까지, 버블이 조준 영역에 닿는 줄(DEAD_ROW)까지 내려오면 게임 오버
+PUSH_SHOTS = 6
+BOARD_H = 105
+DEAD_ROW = 0
+while bubble_grid.cy[DEAD_ROW * COLS] + DRAW_RADIUS < BOARD_H: DEAD_ROW += 1
 
 def draw_circle(x, y, r, color):
-    tft.fillrect(int(x-r+2), int(y-r), int(2*r-4), int(2*r), color)
-    tft.fillrect(int(x-r), int(y-r+2), int(2*r), int(2*r-4), color)
+    # 정수 좌표만 받음 (하이라이트 위치 = 예전 int(x - r/2))
+    tft.fillcircle(x, y, r, color)
     if color != BLACK:
-        tft.fillrect(int(x-r/2), int(y-r/2), 2, 2, WHITE)
+        h = (r + 1) >> 1
+        tft.fillrect(x - h, y - h, 2, 2, WHITE)
+
+# 조준 각도: 20~160도, 5도 단위 (29가지)
+AIM_MIN = 20
+AIM_MAX = 160
+AIM_STEP = 5
+
+def aim_table(x0, y0):
+    # 각도별 조준점 좌표 (x, y, x, y, ...) - 발사 버블(반지름 5)과 겹치는 가장 안쪽 점은 뺌
+    t = []
+    for a in range(AIM_MIN, AIM_MAX + 1, AIM_STEP):
+        rad = math.radians(a)
+        d = bytearray()
+        for i in range(7, 20, 2):
+            d.append(int(x0 + math.cos(rad) * i))
+            d.append(int(y0 - math.sin(rad) * i))
+        t.append(d)
+    return t
+
+# 각도별 발사 속도 (프레임당 12픽셀, 고정소수점) / 날아가는 버블
+SHOT_VX, SHOT_VY = velocity_table(12, AIM_MIN, AIM_MAX, AIM_STEP)
+shot = Shot(bubble_grid, 160)
+
+class ShooterHUD(object):
+    # 아래쪽 조준 영역: 조준선은 이전 점만 지우고 새 점을 찍음, 버블은 색이 바뀔 때만 다시 그림
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self._dots = aim_table(x, y)
+        self.invalidate()
+
+    def invalidate(self):
+        # 발사 뒤처럼 영역이 망가졌을 때: 다음 draw()에서 띠 전체를 지우고 다시 그림
+        self._angle = -1
+        self._color = -1
+        self._next = -1
+        self._clear = True
+
+    def draw(self, angle, color, next_color):
+        if self._clear:
+            tft.fillrect(0, 105, 160, 27, BLACK)
+            self._clear = False
+        k = (angle - AIM_MIN) // AIM_STEP
+        if k != self._angle:
+            if self._angle >= 0:
+                d = self._dots[self._angle]
+                for j in range(0, len(d), 2): tft.fillrect(d[j], d[j+1], 2, 2, BLACK)
+            d = self._dots[k]
+            for j in range(0, len(d), 2): tft.fillrect(d[j], d[j+1], 2, 2, WHITE)
+            self._angle = k
+        if color != self._color:
+            draw_circle(self.x, self.y, DRAW_RADIUS, PALETTE[color])
+            self._color = color
+        if next_color != self._next:
+            draw_circle(10, 125, 4, PALETTE[next_color])
+            self._next = next_color
+        tft.flush()
 
 def get_bubble_coords(r, c):
-    y = r * ROW_HEIGHT + GRID_RADIUS + 2 
-    offset = GRID_RADIUS if r % 2 == 1 else 0
-    x = c * GRID_DIA + GRID_RADIUS + offset + 2
-    return int(x), int(y)
-
-def check_matches(grid, r, c, color, visited):
-    if (r, c) in visited: return []
-    if r < 0 or r >= ROWS or c < 0 or c >= COLS: return []
-    if grid[r][c] != color: return []
-    
-    visited.add((r, c))
-    matches = [(r, c)]
-    directions = [(-1,0), (1,0), (0,-1), (0,1), (-1,-1), (-1,1), (1,-1), (1,1)]
-    for dr, dc in directions:
-        matches += check_matches(grid, r+dr, c+dc, color, visited)
-    return matches
-
-def count_bubbles(grid):
-    cnt = 0
-    for r in range(ROWS):
-        for c in range(COLS):
-            if grid[r][c] != 0: cnt += 1
-    return cnt
+    return bubble_grid.coords(r, c)
+
+def draw_board():
+    for i in range(ROWS * COLS):
+        v = bubble_grid.cells[i]
+        if v != 0:
+            bubble_sprites.draw(bubble_grid.cx[i], bubble_grid.cy[i], v)
+
+def push_bubble_row():
+    # 격자를 한 줄 내리고 (기존 버블 x 좌표는 그대로) 보드 띠를 줄 높이만큼 스크롤, 새 줄만 그림
+    # 프레임버퍼가 없으면 스크롤할 수 없으므로 보드를 다시 그림
+    bubble_grid.push_row([pick_color() for _ in range(COLS)])
+    with tft.section("board"):
+        if tft.scroll(0, BOARD_H, ROW_HEIGHT, BLACK):
+            for c in range(COLS):
+                gx, gy = get_bubble_coords(0, c)
+                bubble_sprites.draw(gx, gy, bubble_grid.get(0, c))
+        else:
+            tft.fillrect(0, 0, 160, BOARD_H, BLACK)
+            draw_board()
+        tft.flush()
+
+def pick_color():
+    # 보드에 남아 있는 색 중에서만 고름 (색 번호)
+    counts = bubble_grid.color_counts
+    present = [v for v in range(1, len(counts)) if counts[v]]
+    if present:
+        return random.choice(present)
+    return random.randint(1, len(COLORS))
 
 def run_bubble_game():
-    global bubble_grid
-    bubble_grid = [[0] * COLS for _ in range(ROWS)]
+    bubble_grid.clear()
     for r in range(4):
         for c in range(COLS):
-            bubble_grid[r][c] = random.choice(COLORS)
+            bubble_grid.set(r, c, random.randint(1, len(COLORS)))
             
     shooter_angle = 90
-    shooter_color = random.choice(COLORS)
-    next_color = random.choice(COLORS)
+    shooter_color = pick_color()
+    next_color = pick_color()
     shooter_x = 80
     shooter_y = 125
+    hud = ShooterHUD(shooter_x, shooter_y)
     
-    tft.fill(BLACK)
-    for r in range(ROWS):
-        for c in range(COLS):
-            if bubble_grid[r][c] != 0:
-                gx, gy = get_bubble_coords(r, c)
-                draw_circle(gx, gy, DRAW_RADIUS, bubble_grid[r][c])
+    with tft.section("board"):
+        tft.fill(BLACK)
+        draw_board()
+        tft.flush()
                 
+    shots = 0
+    buttons.clear()
     playing = True
     while playing:
-        # [수정됨] 32번: 메인으로 돌아가기
-        if btn_32.value() == 0:
-            return
-
-        rad = math.radians(shooter_angle)
-        tft.fillrect(0, 105, 160, 27, BLACK)
-        
-        for i in range(5, 20, 2):
-            px = shooter_x + math.cos(rad) * i
-            py = shooter_y - math.sin(rad) * i
-            tft.fillrect(int(px), int(py), 2, 2, WHITE)
-            
-        draw_circle(shooter_x, shooter_y, DRAW_RADIUS, shooter_color)
-        draw_circle(10, 125, 4, next_color)
+        # 각도만 바뀌면 조준점 몇 개만 다시 그림
+        with tft.section("aim"):
+            hud.draw(shooter_angle, shooter_color, next_color)
         
         fired = False
         while not fired:
             # [수정됨] 버블 게임 키 매핑
             # 27:오른쪽(각도감소), 14:왼쪽(각도증가), 12:발사, 32:나가기
             
-            if btn_32.value() == 0: # 대기 중 나가기
+            # 버튼 이벤트가 올 때까지 대기 (누르고 있으면 REPEAT로 계속 회전)
+            ev = buttons.wait(1000)
+            if ev < 0 or (ev & 0xF0) == RELEASE:
+                continue
+            b = ev & 0x0F
+
+            if b == BTN_32: # 대기 중 나가기
                 return
 
-            if btn_14.value() == 0: # 왼쪽으로 이동 (각도 증가)
-                if shooter_angle < 160: shooter_angle += 5
+            if b == BTN_14: # 왼쪽으로 이동 (각도 증가)
+                if shooter_angle < AIM_MAX: shooter_angle += AIM_STEP
                 break
-            if btn_27.value() == 0: # 오른쪽으로 이동 (각도 감소)
-                if shooter_angle > 20: shooter_angle -= 5
+            if b == BTN_27: # 오른쪽으로 이동 (각도 감소)
+                if shooter_angle > AIM_MIN: shooter_angle -= AIM_STEP
                 break
-            if btn_12.value() == 0: # 발사
+            if ev == PRESS | BTN_12: # 발사 (누르고 있어도 한 번만)
                 fired = True
-                while btn_12.value() == 0: time.sleep(0.01)
-            time.sleep(0.04)
         
         if not fired:
             continue
             
-        bx, by = shooter_x, shooter_y
-        dx = math.cos(rad) * 12
-        dy = -math.sin(rad) * 12
+        # 각도표에서 속도를 꺼내 정수(고정소수점)로만 이동/반사/충돌 계산
+        k = (shooter_angle - AIM_MIN) // AIM_STEP
+        shot.start(shooter_x, shooter_y, SHOT_VX[k], SHOT_VY[k])
         moving = True
         
         while moving:
-            draw_circle(bx, by, DRAW_RADIUS, BLACK)
-            bx += dx
-            by += dy
-            
-            if bx <= GRID_RADIUS or bx >= 160 - GRID_RADIUS:
-                dx = -dx; bx += dx
-            if by <= GRID_RADIUS: moving = False
-            
-            for r in range(ROWS):
-                gx_dummy, gy = get_bubble_coords(r, 0)
-                if abs(gy - by) > GRID_DIA: continue
-                for c in range(COLS):
-                    if bubble_grid[r][c] != 0:
-                        gx, gy = get_bubble_coords(r, c)
-                        if math.sqrt((bx-gx)**2 + (by-gy)**2) < GRID_DIA - 1:
-                            moving = False
-            
-            if moving: draw_circle(bx, by, DRAW_RADIUS, shooter_color)
-            else: draw_circle(bx, by, DRAW_RADIUS, BLACK)
+            flight_clock.begin()
+            ox, oy = shot.x(), shot.y()
+            moving = shot.step()
+            bx, by = shot.x(), shot.y()
             
-            time.sleep(0.01)
+            flight_clock.rendering()
+            with tft.section("flight"):
+                draw_circle(ox, oy, DRAW_RADIUS, BLACK)
+                if moving: draw_circle(bx, by, DRAW_RADIUS, PALETTE[shooter_color])
+                else: draw_circle(bx, by, DRAW_RADIUS, BLACK)
+                flight_clock.end(tft.flush)
             
-        best_dist = 9999
-        best_r, best_c = -1, -1
-        for r in range(ROWS):
-            for c in range(COLS):
-                if bubble_grid[r][c] == 0:
-                    gx, gy = get_bubble_coords(r, c)
-                    dist = math.sqrt((bx-gx)**2 + (by-gy)**2)
-                    if dist < best_dist:
-                        best_dist = dist; best_r = r; best_c = c
+        # 날아간 버블이 조준 영역을 지나갔으므로 다음 조준 때 다시 그림
+        hud.invalidate()
+
+        # 주변 몇 칸만 보고 착지할 빈 칸을 고름 (지름 1.5배 안에 없으면 -1)
+        best_r, best_c = shot.snap()
                         
-        if best_r != -1 and best_dist < GRID_DIA * 1.5:
-            bubble_grid[best_r][best_c] = shooter_color
+        if best_r != -1:
+            bubble_grid.set(best_r, best_c, shooter_color)
             
-            matches = check_matches(bubble_grid, best_r, best_c, shooter_color, set())
-            if len(matches) >= 3:
-                for r, c in matches:
-                    bubble_grid[r][c] = 0
-                    gx, gy = get_bubble_coords(r, c)
-                    draw_circle(gx, gy, DRAW_RADIUS, BLACK)
-                for r, c in matches:
-                    for dr, dc in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)]:
-                        nr, nc = r+dr, c+dc
-                        if 0<=nr<ROWS and 0<=nc<COLS and bubble_grid[nr][nc]!=0:
-                            gx, gy = get_bubble_coords(nr, nc)
-                            draw_circle(gx, gy, DRAW_RADIUS, bubble_grid[nr][nc])
-            else:
-                gx, gy = get_bubble_coords(best_r, best_c)
-                draw_circle(gx, gy, DRAW_RADIUS, shooter_color)
+            # 같은 색 3개 이상이면 지우고, 천장과 끊어진 묶음도 같이 떨어뜨림
+            # (격자 버블 사각형끼리는 겹치지 않으므로 사각형으로 지워도 이웃 버블은 그대로)
+            matched, dropped = bubble_grid.pop(best_r, best_c)
+            with tft.section("land"):
+                if matched:
+                    for i in matched + dropped:
+                        bubble_sprites.erase(bubble_grid.cx[i], bubble_grid.cy[i])
+                else:
+                    gx, gy = get_bubble_coords(best_r, best_c)
+                    bubble_sprites.draw(gx, gy, shooter_color)
+                tft.flush()
                 
+            # 다음 버블은 보드에 남은 색에서만 (이미 받아둔 next_color가 사라진 색이면 다시 고름)
             shooter_color = next_color
-            next_color = random.choice(COLORS)
+            if bubble_grid.count and bubble_grid.color_counts[shooter_color] == 0:
+                shooter_color = pick_color()
+            next_color = pick_color()
             
-            if count_bubbles(bubble_grid) == 0:
+            # 남은 버블 수는 격자가 바로 알고 있음 (전체 스캔 없음)
+            if bubble_grid.count == 0:
                 tft.fill(BLACK)
                 for _ in range(3):
-                    tft.fill(GREEN); time.sleep(0.2)
-                    tft.fill(BLUE); time.sleep(0.2)
+                    tft.fill(GREEN); tft.flush(); time.sleep(0.2)
+                    tft.fill(BLUE); tft.flush(); time.sleep(0.2)
                 return 
 
+        # 몇 발마다 천장에서 한 줄 내려옴, 버블이 조준 영역까지 내려오면 게임 오버
+        shots += 1
+        if shots % PUSH_SHOTS == 0:
+            push_bubble_row()
+        if bubble_grid.lowest_row() >= DEAD_ROW:
+            for _ in range(3):
+                tft.fill(RED); tft.flush(); time.sleep(0.2)
+                tft.fill(BLACK); tft.flush(); time.sleep(0.2)
+            return
+
 # ==========================================
 # 5. 메인 메뉴 시스템 (버튼 로직 수정됨)
 # ==========================================
-def draw_menu_ui(selected_idx):
-    tft.fill(BLACK)
-    
-    color1 = YELLOW if selected_idx == 0 else GRAY
-    tft.fillrect(40, 20, 80, 40, color1)
-    tft.fillrect(42, 22, 76, 36, BLACK)
-    tft.fillrect(50, 30, 60, 5, BLUE)
-    tft.fillrect(50, 45, 60, 5, BLUE)
-    tft.fillrect(50, 30, 5, 20, BLUE)
-    tft.fillrect(105, 30, 5, 20, BLUE)
-    tft.fillrect(20, 30, 5, 20, WHITE) 
-
-    color2 = YELLOW if selected_idx == 1 else GRAY
-    tft.fillrect(40, 70, 80, 40, color2)
-    tft.fillrect(42, 72, 76, 36, BLACK)
-    draw_circle(60, 90, 6, RED)
-    draw_circle(75, 90, 6, GREEN)
-    draw_circle(90, 90, 6, BLUE)
-    draw_circle(67, 80, 6, YELLOW)
-    draw_circle(82, 80, 6, MAGENTA)
-    tft.fillrect(20, 75, 15, 5, WHITE)
-    tft.fillrect(30, 75, 5, 10, WHITE)
-    tft.fillrect(20, 85, 15, 5, WHITE)
-    tft.fillrect(20, 85, 5, 10, WHITE)
-    tft.fillrect(20, 95, 15, 5, WHITE)
+# 메뉴 카드 내용 (카드 왼쪽 위 좌표 기준, 번호는 카드 왼쪽 바깥)
+def draw_maze_icon(x, y):
+    tft.fillrect(x + 10, y + 10, 60, 5, BLUE)
+    tft.fillrect(x + 10, y + 25, 60, 5, BLUE)
+    tft.fillrect(x + 10, y + 10, 5, 20, BLUE)
+    tft.fillrect(x + 65, y + 10, 5, 20, BLUE)
+    tft.text(x - 22, y + 10, "1", WHITE, BLACK, 3)
+
+def draw_bubble_icon(x, y):
+    draw_circle(x + 20, y + 20, 6, RED)
+    draw_circle(x + 35, y + 20, 6, GREEN)
+    draw_circle(x + 50, y + 20, 6, BLUE)
+    draw_circle(x + 27, y + 10, 6, YELLOW)
+    draw_circle(x + 42, y + 10, 6, MAGENTA)
+    tft.text(x - 22, y + 5, "2", WHITE, BLACK, 3)
+
+# 메뉴 항목: (카드 내용, 게임 실행, 프레임 통계) - 게임을 추가해도 선택 이동 비용은 그대로
+MENU_GAMES = (
+    (draw_maze_icon, run_maze_game, maze_clock),
+    (draw_bubble_icon, run_bubble_game, flight_clock),
+)
+# 선택이 바뀌면 두 카드의 테두리(2픽셀)만 다시 그림 (화면에 다 안 들어가면 보이는 범위를 옮겨 다시 그림)
+menu = Menu(tft, [g[0] for g in MENU_GAMES], 40, 20, 80, 40, 10, YELLOW, GRAY, BLACK)
 
 def main_system():
-    selected = 0 
-    draw_menu_ui(selected)
+    menu.draw()
     
     while True:
         # [수정됨] 메인 메뉴 키 매핑
         # 27:위, 14:아래, 12:선택
+        ev = buttons.wait(1000)
         
-        if btn_27.value() == 0: # 위로 이동
-            if selected == 1:
-                selected = 0
-                draw_menu_ui(selected)
-            time.sleep(0.15)
-            
-        elif btn_14.value() == 0: # 아래로 이동
-            if selected == 0:
-                selected = 1
-                draw_menu_ui(selected)
-            time.sleep(0.15)
+        if ev == PRESS | BTN_27: # 위로 이동
+            menu.move(-1)
             
-        elif btn_12.value() == 0: # 선택
-            if selected == 0:
-                run_maze_game()
-            else:
-                run_bubble_game()
+        elif ev == PRESS | BTN_14: # 아래로 이동
+            menu.move(1)
             
-            draw_menu_ui(selected)
-            while btn_12.value() == 0: time.sleep(0.01)
+        elif ev == PRESS | BTN_12: # 선택
+            _, run, clock = MENU_GAMES[menu.selected]
+            run()
+            if SHOW_FRAME_STATS: clock.report()
+            if PROFILE_SPI: tft.profile().report()
             
-        time.sleep(0.05)
+            # 게임이 화면 전체를 덮었으므로 메뉴는 처음부터 다시 그림
+            menu.draw()
+            # 게임 중에 쌓인 입력(나갈 때 누른 버튼 등)은 메뉴로 넘기지 않음
+            buttons.clear()
 
-main_system()
\ No newline at end of file
+# 보드에서 main.py로 실행할 때만 바로 시작 (PC 시뮬레이터는 import만 하고 직접 돌림)
+if __name__ == "__main__":
+    main_system()
\ No newline at end of file
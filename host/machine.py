@@ -0,0 +1,92 @@
+# host/machine.py
+# PC에서 쓰는 machine 모듈 대역 (sys.path 맨 앞에 host 폴더를 넣고 import)
+# SPI 전송은 sim.panel 이 해석하고, 시간은 sim 의 가상 시계를 씀
+import sim
+
+HOST = True
+
+PWRON_RESET = 1
+HARD_RESET = 2
+WDT_RESET = 3
+DEEPSLEEP_RESET = 4
+SOFT_RESET = 5
+
+
+def reset_cause():
+    return sim.reset_cause
+
+
+def idle():
+    sim.advance_us(1000)
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state):
+    pass
+
+
+class Pin(object):
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 2
+    PULL_DOWN = 1
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._mode = mode
+        self._v = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self._v = value
+        self._handler = None
+        self._trigger = 0
+        sim.pins[id] = self
+
+    def value(self, v=None):
+        if v is None:
+            return self._v
+        self._v = 1 if v else 0
+        sim.panel.pin_changed(self.id, self._v)
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self._handler = handler
+        self._trigger = trigger
+
+    def _external(self, level):
+        # sim에서 입력 레벨을 바꿀 때 호출 (엣지에 맞는 인터럽트 핸들러 실행)
+        old = self._v
+        self._v = level
+        if self._handler is None or old == level:
+            return
+        if (level == 0 and self._trigger & Pin.IRQ_FALLING) or (level == 1 and self._trigger & Pin.IRQ_RISING):
+            self._handler(self)
+
+
+class SPI(object):
+    def __init__(self, id, baudrate=1000000, polarity=0, phase=0, bits=8, firstbit=0,
+                 sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=None, **kw):
+        if baudrate:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        sim.panel.write(buf, self.baudrate)
@@ -0,0 +1,266 @@
+# host/replay.py
+# 녹화한 버튼 입력으로 두 게임을 가상 하드웨어(sim)에서 돌려 비용을 재는 회귀 벤치마크
+#
+# 사용법 (저장소 루트에서):
+#   python host/replay.py               -> 시나리오별 결과를 기준값과 비교 (나빠진 항목이 있으면 종료 코드 1)
+#   python host/replay.py --update      -> 지금 결과를 기준값(replay_baseline.json)으로 저장
+#   python host/replay.py maze_solve    -> 이름을 준 시나리오만
+#
+# 시나리오마다 전원 켜기부터 다시 시작하고 random 시드를 고정하므로 같은 코드면 같은 화면/전송이 나옴
+# 재는 값:
+#   bytes, windows  SPI 전송 바이트 / 창 설정(RAMWR) 횟수 - 가상 패널이 셈, 항상 같아야 함
+#   virtual_ms      가상 시계 (sleep + 메인 스레드 SPI 전송 시간)
+#   alloc_kb        시나리오 중 파이썬 힙 최대 증가량 (tracemalloc)
+#   wall_ms         PC에서 실제 걸린 시간 (시뮬레이터 비용 포함) - 기계/부하마다 달라서 참고로 출력만 하고
+#                   판정에는 쓰지 않음
+#   outcome         게임 진행 결과 (깬 레벨 수, 쏜 발 수 등) - 다르면 입력 스크립트가 더 이상 맞지 않는 것
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+if HERE not in sys.path:
+    sys.path.insert(0, HERE)
+import sim
+
+BASELINE = os.path.join(HERE, "replay_baseline.json")
+SEED = 2024
+
+# 항목별 허용 폭 (상대, 절대): 새 값 > 기준값 * (1 + 상대) + 절대 이면 나빠진 것
+# 여기 없는 항목(wall_ms)은 출력만 함
+TOLERANCE = {
+    "bytes": (0.01, 0),
+    "windows": (0.01, 0),
+    "virtual_ms": (0.02, 5),
+    "alloc_kb": (0.10, 4),
+}
+
+# 게임 버튼 핀 (game.py 하드웨어 설정과 같음)
+BTN_UP, BTN_DOWN, BTN_SELECT = 27, 14, 12
+BTN_MAZE = {(1, 0): 25, (-1, 0): 33, (0, 1): 26, (0, -1): 32}
+BTN_AIM = (27, 14)
+
+
+# ------------------------------------------
+# 시나리오 (g = 막 켠 game 모듈, 반환값 = outcome)
+# ------------------------------------------
+def level_load(g):
+    # 기본 레벨 전부 + 생성 레벨 하나를 그림
+    for i in range(len(g.maze_levels)):
+        g.draw_maze_map(g.maze_levels.level(i))
+    g.draw_maze_map(g.mazegen.level(SEED))
+    return {"levels": len(g.maze_levels) + 1}
+
+
+def _maze_path(level):
+    # 시작 -> 도착 최단 경로 (타일 좌표 리스트, BFS)
+    start = level.start
+    prev = {start: None}
+    queue = [start]
+    while queue:
+        p = queue.pop(0)
+        if p == level.goal:
+            break
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            n = (p[0] + dx, p[1] + dy)
+            if 0 <= n[0] < level.w and 0 <= n[1] < level.h and n not in prev and level.tile(n[0], n[1]) != 1:
+                prev[n] = p
+                queue.append(n)
+    path = [level.goal]
+    while prev[path[-1]] is not None:
+        path.append(prev[path[-1]])
+    return path[::-1]
+
+
+def maze_script(level, tile, speed, frame_ms, at_ms=200, gap_ms=60):
+    # 최단 경로를 방향별 구간으로 묶어 (핀, 시각 ms, 누르는 시간 ms) 목록으로
+    # 누르는 시간 = 다음 꺾는 칸까지 필요한 프레임 수 (플레이어는 칸 안쪽 +2 픽셀에서 출발)
+    path = _maze_path(level)
+    segs = []
+    for a, b in zip(path, path[1:]):
+        d = (b[0] - a[0], b[1] - a[1])
+        if segs and segs[-1][0] == d:
+            segs[-1][1] += 1
+        else:
+            segs.append([d, 1])
+    pos = [level.start[0] * tile + 2, level.start[1] * tile + 2]
+    cell = list(level.start)
+    script = []
+    t = at_ms
+    for d, k in segs:
+        axis = 0 if d[0] else 1
+        sign = d[0] or d[1]
+        cell[axis] += sign * k
+        frames = (abs(cell[axis] * tile + 2 - pos[axis]) + speed - 1) // speed
+        pos[axis] += sign * frames * speed
+        hold = frames * frame_ms - frame_ms // 2
+        script.append((BTN_MAZE[d], t, hold))
+        t += hold + gap_ms
+    return script, t
+
+
+def maze_solve(g):
+    # 첫 레벨을 최단 경로로 깨고 다음 레벨이 그려질 때까지
+    script, end = maze_script(g.maze_levels.level(0), g.TILE_SIZE, 2, g.MAZE_FRAME_MS)
+    for pin, at, hold in script:
+        sim.press(pin, at, hold)
+    drawn = []
+    draw = g.draw_maze_map
+
+    def draw_maze_map(level):
+        drawn.append(level.start)
+        draw(level)
+    g.draw_maze_map = draw_maze_map
+    sim.stop_at(end + 1500)
+    try:
+        g.run_maze_game()
+    except sim.Stop:
+        pass
+    return {"levels_drawn": len(drawn)}
+
+
+def bubble_session(g, shots=50):
+    # 버블 50발: 발사할 때마다 다음 조준(좌/우 누르기) + 발사를 예약, 게임이 끝나면 새 게임으로 이어감
+    rnd = random.Random(SEED)
+    fired = [0]
+    start = g.shot.start
+
+    def plan():
+        t = sim.press(rnd.choice(BTN_AIM), 300, rnd.randrange(60, 700)) + 50
+        sim.press(BTN_SELECT, t)
+
+    def shot_start(*args):
+        fired[0] += 1
+        if fired[0] < shots:
+            plan()
+        else:
+            sim.stop_at(1500)
+        return start(*args)
+    g.shot.start = shot_start
+    sim.stop_at(shots * 3000)   # 입력 스크립트가 어긋나도 끝나도록
+    games = 0
+    try:
+        while fired[0] < shots:
+            games += 1
+            plan()
+            g.run_bubble_game()
+    except sim.Stop:
+        pass
+    return {"shots": fired[0], "games": games, "left": g.bubble_grid.count}
+
+
+def menu_nav(g):
+    # 메뉴에서 아래/위 10번씩 (이미 끝이면 무시되는 입력 포함)
+    t = 200
+    for i in range(20):
+        t = sim.press(BTN_DOWN if i % 4 < 2 else BTN_UP, t) + 120
+    sim.stop_at(t + 200)
+    try:
+        g.main_system()
+    except sim.Stop:
+        pass
+    return {"selected": g.menu.selected}
+
+
+SCENARIOS = (
+    ("level_load", level_load),
+    ("maze_solve", maze_solve),
+    ("bubble_50", bubble_session),
+    ("menu_nav", menu_nav),
+)
+
+
+# ------------------------------------------
+# 실행 / 비교
+# ------------------------------------------
+def run(name, scenario):
+    g, _ = sim.boot()
+    random.seed(SEED)
+    sim.panel.reset_counters()
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    v0 = sim.now_us()
+    t0 = time.perf_counter()
+    outcome = scenario(g)
+    sim.stop_at(None)
+    g.tft.fence()
+    wall = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    g.tft.async_flush(False)
+    return {
+        "bytes": sim.panel.bytes,
+        "windows": sim.panel.windows,
+        "virtual_ms": round((sim.now_us() - v0) / 1000.0, 1),
+        "alloc_kb": round(peak / 1024.0, 1),
+        "wall_ms": round(wall * 1000, 1),
+        "outcome": outcome,
+    }
+
+
+def compare(name, new, old):
+    # 나빠진 항목 수를 돌려주고 표를 출력
+    bad = 0
+    print(name)
+    for key in ("bytes", "windows", "virtual_ms", "alloc_kb", "wall_ms"):
+        a = old.get(key)
+        b = new[key]
+        if a is None:
+            print("  %-10s %10s -> %10s" % (key, "-", b))
+            continue
+        change = (b - a) * 100.0 / a if a else 0.0
+        mark = ""
+        rel, slack = TOLERANCE.get(key, (None, 0))
+        if rel is None:
+            mark = "  (참고, 판정 안 함)"
+        elif b > a * (1 + rel) + slack:
+            mark = "  << 나빠짐"
+            bad += 1
+        elif b < a * (1 - rel) - slack:
+            mark = "  좋아짐 (--update로 기준값 갱신)"
+        print("  %-10s %10s -> %10s  %+6.1f%%%s" % (key, a, b, change, mark))
+    if new["outcome"] != old.get("outcome"):
+        print("  outcome    %s -> %s  << 진행 결과가 다름" % (old.get("outcome"), new["outcome"]))
+        bad += 1
+    return bad
+
+
+def main(argv):
+    update = "--update" in argv
+    names = [a for a in argv if not a.startswith("-")]
+    try:
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+    results = {}
+    bad = 0
+    for name, scenario in SCENARIOS:
+        if names and name not in names:
+            continue
+        results[name] = r = run(name, scenario)
+        if update:
+            print("%-10s %s" % (name, json.dumps(r, sort_keys=True)))
+        elif name not in baseline:
+            print("%s: 기준값 없음 (--update로 저장)" % name)
+            bad += 1
+        else:
+            bad += compare(name, r, baseline[name])
+    if update:
+        baseline.update(results)
+        with open(BASELINE, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("기준값 저장: %s" % BASELINE)
+        return 0
+    print("나빠진 항목 %d개" % bad if bad else "모두 기준값 이내")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,459 @@
+# host/sim.py
+# PC(CPython)용 가상 하드웨어: ST7735 패널 / 가상 시계 / 버튼 입력 스크립트
+#
+# 사용법 (저장소 루트에서):
+#   python host/sim.py                      -> 메뉴와 미로 게임을 잠깐 돌리고 frame.png 저장
+#   python host/sim.py --profile            -> 위와 같고 SPI 프로파일(태그별 비용)도 출력
+#   import sys; sys.path.insert(0, "host")
+#   import sim; game = sim.load_game()      -> machine 대역으로 game.py를 불러옴 (메인 루프는 안 돎)
+#
+# 시간은 실제로 흐르지 않고 sleep/idle/SPI 전송만큼 가상 시계가 앞으로 감
+# (SPI 전송 시간 = 바이트 * 8 / baudrate)
+# 전송 스레드(spiflush)에서 보낸 전송은 메인 루프와 겹쳐 돈다고 보고 시계를 움직이지 않음 (bus_us에만 더함)
+import _thread
+import os
+import struct
+import sys
+import time
+import zlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if HERE not in sys.path:
+    sys.path.insert(0, HERE)
+if ROOT not in sys.path:
+    sys.path.insert(1, ROOT)
+
+# 게임에서 쓰는 배선 (game.py 하드웨어 설정과 같음)
+DC_PIN = 2
+CS_PIN = 5
+RESET_PIN = 4
+
+# machine.reset_cause() 가 돌려줄 값 (machine.PWRON_RESET = 1, SOFT_RESET = 5)
+reset_cause = 1
+
+
+class Stop(Exception):
+    # stop_at()으로 정한 시각이 지나면 게임 루프를 빠져나오기 위해 발생
+    pass
+
+
+# ------------------------------------------
+# 가상 시계 + 예약된 입력
+# ------------------------------------------
+_now_us = 0
+_main_thread = _thread.get_ident()
+_deadline_us = None
+_events = []        # (시각 us, 핀 번호, 레벨) - 시각 순
+pins = {}           # 핀 번호 -> machine.Pin
+
+
+def now_us():
+    return _now_us
+
+
+def advance_us(us):
+    global _now_us
+    target = _now_us + int(us)
+    while _events and _events[0][0] <= target:
+        t, pin_id, level = _events.pop(0)
+        if t > _now_us:
+            _now_us = t
+        set_pin(pin_id, level)
+    _now_us = target
+    if _deadline_us is not None and _now_us >= _deadline_us:
+        raise Stop()
+
+
+def set_pin(pin_id, level):
+    # 입력 핀 레벨을 바꾸고, 등록된 인터럽트 핸들러가 있으면 호출
+    p = pins.get(pin_id)
+    if p is None:
+        return
+    p._external(level)
+
+
+def press(pin_id, at_ms, hold_ms=80):
+    # at_ms(현재 기준 상대 시각)에 버튼을 눌렀다가 hold_ms 뒤에 뗌 (풀업 버튼: 눌림 = 0)
+    t = _now_us + int(at_ms * 1000)
+    _schedule(t, pin_id, 0)
+    _schedule(t + int(hold_ms * 1000), pin_id, 1)
+    return at_ms + hold_ms
+
+
+def _schedule(t, pin_id, level):
+    i = len(_events)
+    while i > 0 and _events[i - 1][0] > t:
+        i -= 1
+    _events.insert(i, (t, pin_id, level))
+
+
+def stop_at(ms):
+    # 현재 기준 ms 뒤에 Stop 예외 발생 (None이면 해제)
+    global _deadline_us
+    _deadline_us = None if ms is None else _now_us + int(ms * 1000)
+
+
+def reset(keep_panel=False):
+    # 시계/입력/핀을 처음 상태로 (keep_panel=True면 패널은 켜진 그대로 = 소프트 리셋)
+    global _now_us, _deadline_us
+    _now_us = 0
+    _deadline_us = None
+    del _events[:]
+    pins.clear()
+    if keep_panel:
+        panel.log = []
+        panel.display_on_at = None
+        panel.violations = []
+        panel._reset_at = None
+        panel._wake_at = None
+        panel.reset_counters()
+    else:
+        panel.__init__(panel.width, panel.height)
+
+
+# time 모듈에 MicroPython 함수와 가상 시계를 연결
+_MASK = (1 << 30) - 1
+_HALF = 1 << 29
+
+
+def _ticks_diff(a, b):
+    return ((a - b + _HALF) & _MASK) - _HALF
+
+
+time.sleep = lambda s: advance_us(s * 1000000)
+time.sleep_ms = lambda ms: advance_us(ms * 1000)
+time.sleep_us = lambda us: advance_us(us)
+time.ticks_ms = lambda: (_now_us // 1000) & _MASK
+time.ticks_us = lambda: _now_us & _MASK
+time.ticks_add = lambda t, d: (t + d) & _MASK
+time.ticks_diff = _ticks_diff
+
+
+# ------------------------------------------
+# ST7735 패널
+# ------------------------------------------
+CASET = 0x2A
+RASET = 0x2B
+RAMWR = 0x2C
+MADCTL = 0x36
+COLMOD = 0x3A
+SWRESET = 0x01
+SLPIN = 0x10
+SLPOUT = 0x11
+DISPOFF = 0x28
+DISPON = 0x29
+
+# MADCTL 비트: MY 줄 뒤집기, MX 열 뒤집기, MV 줄/열 바꾸기
+MADCTL_MY = 0x80
+MADCTL_MX = 0x40
+MADCTL_MV = 0x20
+
+# 게임 패널의 원래(회전 0, 세로) 크기 (st7735.PANEL_132x160)
+PANEL_W = 132
+PANEL_H = 160
+
+
+class Panel(object):
+    # SPI로 들어오는 명령/데이터를 해석해서 RGB565 화면 메모리에 그림
+    # 화면 메모리(image)는 패널 원래 방향(회전 0, 세로) width x height
+    # CASET/RASET 좌표는 MADCTL(MV/MX/MY)로 보이는 방향의 좌표 -> 메모리 위치로 바꿔서 씀
+    # get()/view()/save_png()는 지금 MADCTL 방향으로 보이는 그림
+    def __init__(self, width=PANEL_W, height=PANEL_H):
+        self.width = width
+        self.height = height
+        self.image = bytearray(width * height * 2)
+        self.dc = 1
+        self.cs = 1
+        self.rst = 1
+
+        self._cmd = None
+        self._params = bytearray()
+        self._x0 = self._x1 = self._y0 = self._y1 = 0
+        self._pos = 0       # 창 안에서 쓴 픽셀 수
+        self._odd = None    # 픽셀 중간에서 끝난 전송의 남은 바이트
+
+        self.madctl = 0
+        self.colmod = 0
+        self.sleeping = True
+        self.display_on = False
+        self.log = []       # (시각 us, 명령) - 초기화 순서/시간 확인용
+        self.display_on_at = None   # 부팅 뒤 처음 DISPON을 받은 시각 (시작 시간)
+        self.violations = []        # 데이터시트 대기 시간을 지키지 않은 명령
+        self._reset_at = None       # 마지막 리셋(하드웨어/SWRESET) 시각
+        self._wake_at = None        # 마지막 SLPOUT 시각
+
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.bytes = 0
+        self.bus_us = 0
+        self.transactions = 0
+        self.windows = 0
+        self.pixels = 0
+        self.clipped = 0
+        self.commands = {}
+
+    def pin_changed(self, pin_id, level):
+        if pin_id == DC_PIN:
+            self.dc = level
+        elif pin_id == CS_PIN:
+            if self.cs == 1 and level == 0:
+                self.transactions += 1
+            self.cs = level
+        elif pin_id == RESET_PIN and level != self.rst:
+            self.rst = level
+            if level == 0:
+                self.sleeping = True
+                self.display_on = False
+                self.madctl = 0
+                self.colmod = 0
+            else:
+                self._reset_at = _now_us
+
+    def write(self, data, baudrate):
+        data = bytes(data)
+        self.bytes += len(data)
+        cost = len(data) * 8 * 1000000 // baudrate
+        self.bus_us += cost
+        if _thread.get_ident() == _main_thread:
+            advance_us(cost)
+        if self.cs != 0:
+            return  # 선택되지 않은 상태의 전송은 무시
+        if self.dc == 0:
+            for b in data:
+                self._command(b)
+        elif self._cmd == RAMWR:
+            self._pixels(data)
+        else:
+            for b in data:
+                self._param(b)
+
+    def _command(self, cmd):
+        # 데이터시트: 리셋 뒤 SLPOUT까지 120ms, 리셋/SLPOUT 뒤 다음 명령까지 5ms
+        if self._reset_at is not None:
+            since = _now_us - self._reset_at
+            if since < 5000 or (cmd == SLPOUT and since < 120000):
+                self.violations.append((_now_us, cmd, "리셋 뒤 %d us" % since))
+        if self._wake_at is not None and _now_us - self._wake_at < 5000:
+            self.violations.append((_now_us, cmd, "SLPOUT 뒤 %d us" % (_now_us - self._wake_at)))
+        self._cmd = cmd
+        self._params = bytearray()
+        self.commands[cmd] = self.commands.get(cmd, 0) + 1
+        if cmd == RAMWR:
+            self._pos = 0
+            self._odd = None
+            self.windows += 1
+        elif cmd == SWRESET:
+            self.sleeping = True
+            self.display_on = False
+            self._reset_at = _now_us
+        elif cmd == SLPOUT:
+            self.sleeping = False
+            self._wake_at = _now_us
+        elif cmd == SLPIN:
+            self.sleeping = True
+        elif cmd == DISPON:
+            self.display_on = True
+            if self.display_on_at is None:
+                self.display_on_at = _now_us
+        elif cmd == DISPOFF:
+            self.display_on = False
+        self.log.append((_now_us, cmd))
+
+    def _param(self, b):
+        p = self._params
+        p.append(b)
+        if self._cmd == CASET and len(p) == 4:
+            self._x0 = (p[0] << 8) | p[1]
+            self._x1 = (p[2] << 8) | p[3]
+        elif self._cmd == RASET and len(p) == 4:
+            self._y0 = (p[0] << 8) | p[1]
+            self._y1 = (p[2] << 8) | p[3]
+        elif self._cmd == MADCTL and len(p) == 1:
+            self.madctl = b
+        elif self._cmd == COLMOD and len(p) == 1:
+            self.colmod = b
+
+    def size(self):
+        # 지금 MADCTL 방향으로 보이는 화면 (가로, 세로) - MV면 원래 가로/세로가 바뀜
+        if self.madctl & MADCTL_MV:
+            return self.height, self.width
+        return self.width, self.height
+
+    def _map(self, x, y):
+        # 보이는 좌표 (x, y) -> 화면 메모리 픽셀 번호, 보이는 x가 1 늘 때 픽셀 번호 변화
+        m = self.madctl
+        W = self.width
+        if m & MADCTL_MV:
+            px, py = y, x
+            step = -W if m & MADCTL_MY else W
+        else:
+            px, py = x, y
+            step = -1 if m & MADCTL_MX else 1
+        if m & MADCTL_MX: px = W - 1 - px
+        if m & MADCTL_MY: py = self.height - 1 - py
+        return py * W + px, step
+
+    def _span(self, x, y, n, b):
+        # 보이는 줄 y의 x부터 n픽셀이 차지하는 image 바이트 slice (b = 0 상위 / 1 하위 바이트)
+        p, step = self._map(x, y)
+        s = p * 2 + b
+        e = s + n * step * 2
+        return slice(s, e if e >= 0 else None, step * 2)
+
+    def _pixels(self, data):
+        # 창 안에서 보이는 줄 단위로 잘라 화면 메모리에 복사 (화면 밖은 잘라냄)
+        # 보이는 줄이 메모리에서는 열일 수도 있으므로(MV) 바이트를 건너뛰며 복사
+        if self._odd is not None:
+            data = self._odd + data
+            self._odd = None
+        if len(data) & 1:
+            self._odd = data[-1:]
+            data = data[:-1]
+        ww = self._x1 - self._x0 + 1
+        hh = self._y1 - self._y0 + 1
+        if ww <= 0 or hh <= 0:
+            return
+        vw, vh = self.size()
+        img = self.image
+        i = 0
+        n = len(data) // 2
+        while i < n:
+            row = self._pos // ww
+            if row >= hh:
+                row %= hh   # 창을 넘으면 처음으로 돌아감 (패널 동작과 같음)
+                self._pos = row * ww + self._pos % ww
+            ro = self._pos - row * ww
+            k = min(ww - ro, n - i)
+            y = self._y0 + row
+            x = self._x0 + ro
+            lo = max(x, 0)
+            hi = min(x + k, vw)
+            if 0 <= y < vh and lo < hi:
+                o = (i + lo - x) * 2
+                e = o + (hi - lo) * 2
+                img[self._span(lo, y, hi - lo, 0)] = data[o:e:2]
+                img[self._span(lo, y, hi - lo, 1)] = data[o + 1:e:2]
+                self.clipped += k - (hi - lo)
+            else:
+                self.clipped += k
+            self.pixels += k
+            self._pos += k
+            i += k
+
+    def get(self, x, y):
+        # 지금 방향으로 보이는 (x, y)의 색
+        o = self._map(x, y)[0] * 2
+        return (self.image[o] << 8) | self.image[o + 1]
+
+    def view(self):
+        # 지금 방향으로 보이는 그림 (줄 순서 RGB565)
+        vw, vh = self.size()
+        out = bytearray(vw * vh * 2)
+        img = self.image
+        for y in range(vh):
+            o = y * vw * 2
+            out[o:o + vw * 2:2] = img[self._span(0, y, vw, 0)]
+            out[o + 1:o + vw * 2:2] = img[self._span(0, y, vw, 1)]
+        return out
+
+    def rgb888(self):
+        vw, vh = self.size()
+        out = bytearray(vw * vh * 3)
+        img = self.view()
+        j = 0
+        for i in range(0, len(img), 2):
+            c = (img[i] << 8) | img[i + 1]
+            r = (c >> 11) & 0x1F
+            g = (c >> 5) & 0x3F
+            b = c & 0x1F
+            out[j] = (r << 3) | (r >> 2)
+            out[j + 1] = (g << 2) | (g >> 4)
+            out[j + 2] = (b << 3) | (b >> 2)
+            j += 3
+        return out
+
+    def save_ppm(self, path):
+        with open(path, "wb") as f:
+            f.write(b"P6\n%d %d\n255\n" % self.size())
+            f.write(self.rgb888())
+
+    def save_png(self, path):
+        vw, vh = self.size()
+        rgb = self.rgb888()
+        stride = vw * 3
+        raw = b"".join(b"\x00" + bytes(rgb[y * stride:(y + 1) * stride]) for y in range(vh))
+
+        def chunk(kind, body):
+            c = struct.pack(">I", len(body)) + kind + body
+            return c + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", vw, vh, 8, 2, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+            f.write(chunk(b"IEND", b""))
+
+    def report(self):
+        print("SPI %d 바이트 (버스 %.1f ms), 트랜잭션 %d, 창 설정 %d, 픽셀 %d (화면 밖 %d), 가상 시간 %.1f ms" % (
+            self.bytes, self.bus_us / 1000, self.transactions, self.windows, self.pixels, self.clipped,
+            _now_us / 1000))
+
+
+panel = Panel()
+
+
+def load_game():
+    # game.py를 새로 import (하드웨어 설정/초기화까지만 실행되고 메인 루프는 돌지 않음)
+    sys.modules.pop("game", None)
+    import game
+    return game
+
+
+def boot(warm=False):
+    # 전원 켜기(또는 warm=True: 소프트 리셋)부터 game import까지 돌리고 (game, 시작 시간 ms) 반환
+    global reset_cause
+    if warm:
+        old = sys.modules.get("game")
+        if old is not None:
+            old.tft.async_flush(False)
+    reset(keep_panel=warm)
+    reset_cause = 5 if warm else 1
+    game = load_game()
+    ms = (panel.display_on_at or 0) / 1000
+    if panel.sleeping or not panel.display_on:
+        print("경고: 패널이 깨어나지 않음")
+    for t, cmd, what in panel.violations:
+        print("경고: %.1f ms 명령 0x%02X - %s" % (t / 1000, cmd, what))
+    return game, ms
+
+
+def main(profile=False):
+    game, cold = boot()
+    if profile:
+        game.tft.profile()
+    panel.save_png("boot.png")
+    print("시작 시간 (DISPON까지): 전원 켜기 %.1f ms" % cold)
+    t = 200
+    t = press(12, t) + 300      # 메뉴에서 미로 선택
+    t = press(25, t, 400) + 50  # 오른쪽으로 이동
+    stop_at(t + 200)
+    try:
+        game.main_system()
+    except Stop:
+        pass
+    game.tft.fence()
+    panel.save_png("frame.png")
+    panel.report()
+    if profile:
+        game.tft.profile().report()
+    game, warm = boot(warm=True)
+    print("시작 시간 (DISPON까지): 소프트 리셋 %.1f ms" % warm)
+    print("boot.png, frame.png 저장")
+
+
+if __name__ == "__main__":
+    # machine.py가 import하는 sim 모듈과 같은 것을 써야 함 (__main__으로 돌면 별개 모듈이 됨)
+    import sim
+    sim.main("--profile" in sys.argv)
@@ -0,0 +1,156 @@
+# levels.py
+# 미로 레벨 저장 형식 (타일 2비트) + 한 레벨씩 읽는 로더
+#
+# 레벨 묶음 = 머리(6바이트) + 레벨 레코드 * 개수
+#   머리: b"MZ", 가로 타일 수, 세로 타일 수, 레벨 수(2바이트, 리틀엔디언)
+#   레코드: 시작 x, 시작 y, 도착 x, 도착 y (타일 좌표, 각 1바이트) + 타일 (4칸/바이트, 줄 순서, 낮은 비트부터)
+#   타일 값: 0 바닥, 1 벽, 2 시작, 3 도착
+#
+# 레벨 묶음은 bytes(프로그램에 넣어 플래시에 둠) 또는 파일에서 읽음
+#   bytes: memoryview 슬라이스로 복사 없이 / 파일: 필요한 레코드만 읽어서 버퍼 하나를 재사용
+# PC에서 레벨 만들기: pack([parse(text), ...]) 또는 save(path, levels)
+
+MAGIC = b"MZ"
+HEADER = 6
+LEVEL_HEADER = 4
+
+
+def record_size(w, h):
+    return LEVEL_HEADER + (w * h + 3) // 4
+
+
+class Level(object):
+    # 레코드 하나 (memoryview) 위의 읽기 전용 맵: 전체를 풀지 않고 칸 단위로 읽음
+    def __init__(self, w, h, data):
+        self.w = w
+        self.h = h
+        self._data = data
+        self.start = (data[0], data[1])
+        self.goal = (data[2], data[3])
+
+    def tile(self, x, y):
+        i = y * self.w + x
+        return (self._data[LEVEL_HEADER + (i >> 2)] >> ((i & 3) << 1)) & 3
+
+    def row(self, y):
+        # 한 줄 타일 목록 (그리기용)
+        return [self.tile(x, y) for x in range(self.w)]
+
+
+class LevelPack(object):
+    def __init__(self, source):
+        # source: 레벨 묶음 bytes 또는 파일 이름
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            head = self._file.read(HEADER)
+            self._mv = None
+        else:
+            self._file = None
+            self._mv = memoryview(source)
+            head = self._mv[:HEADER]
+        if bytes(head[:2]) != MAGIC:
+            raise ValueError("not a level pack")
+        self.w = head[2]
+        self.h = head[3]
+        self.count = head[4] | (head[5] << 8)
+        self._size = record_size(self.w, self.h)
+        if self._file is not None:
+            self._buf = bytearray(self._size)
+            self._view = memoryview(self._buf)
+
+    def __len__(self):
+        return self.count
+
+    def level(self, i):
+        # i번째 레벨 (파일에서 읽을 때는 버퍼를 재사용하므로 이전에 받은 Level은 덮어써짐)
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        o = HEADER + i * self._size
+        if self._file is None:
+            return Level(self.w, self.h, self._mv[o:o + self._size])
+        self._file.seek(o)
+        self._file.readinto(self._buf)
+        return Level(self.w, self.h, self._view)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# 기본 레벨 3개 (예전 game.py의 MAP_LEVEL_1..3 을 pack()으로 만든 것)
+BUILTIN = (
+    b"\x4d\x5a\x0e\x0b\x03\x00"
+    b"\x01\x09\x0c\x00\x55\x55\x55\x17\x10\x00\x41\x11\x51\x51\x14\x01"  # 레벨 1
+    b"\x01\x40\x55\x11\x55\x15\x00\x01\x40\x51\x55\x51\x14\x10\x00\x41"
+    b"\x15\x15\x15\x95\x00\x00\x40\x55\x55\x55\x05"
+    b"\x01\x01\x0c\x09\x55\x55\x55\x95\x40\x00\x40\x55\x44\x55\x14\x40"  # 레벨 2
+    b"\x40\x40\x51\x55\x44\x15\x00\x40\x40\x55\x55\x54\x14\x00\x04\x44"
+    b"\x51\x45\x45\x14\x00\x00\x74\x55\x55\x55\x05"
+    b"\x0c\x09\x01\x01\x55\x55\x55\xd5\x04\x04\x44\x45\x44\x44\x14\x40"  # 레벨 3
+    b"\x40\x40\x51\x55\x45\x15\x40\x00\x40\x55\x44\x55\x14\x04\x04\x44"
+    b"\x51\x55\x54\x14\x00\x00\x60\x55\x55\x55\x05"
+)
+
+
+# ------------------------------------------
+# 만들기 도구 (PC에서 레벨 묶음을 만들 때)
+# ------------------------------------------
+_CHARS = ".#SG"
+
+
+def parse(text):
+    # 글자 그림 -> 타일 리스트의 리스트 ('.' 바닥, '#' 벽, 'S' 시작, 'G' 도착)
+    return [[_CHARS.index(ch) for ch in line.strip()] for line in text.strip().splitlines()]
+
+
+def draw(rows):
+    # parse()의 반대
+    return "\n".join("".join(_CHARS[t] for t in row) for row in rows)
+
+
+def pack_level(rows):
+    # 타일 리스트의 리스트 -> 레코드 bytes (시작/도착은 맵에서 찾음, 여럿이면 첫 번째)
+    h = len(rows)
+    w = len(rows[0])
+    start = goal = None
+    data = bytearray(record_size(w, h))
+    for y in range(h):
+        if len(rows[y]) != w:
+            raise ValueError("row %d width" % y)
+        for x in range(w):
+            t = rows[y][x]
+            if t == 2 and start is None:
+                start = (x, y)
+            elif t == 3 and goal is None:
+                goal = (x, y)
+            i = y * w + x
+            data[LEVEL_HEADER + (i >> 2)] |= (t & 3) << ((i & 3) << 1)
+    if start is None or goal is None:
+        raise ValueError("level needs a start and a goal")
+    data[0], data[1] = start
+    data[2], data[3] = goal
+    return bytes(data)
+
+
+def pack(levels):
+    # 타일 리스트의 리스트 여러 개 -> 레벨 묶음 bytes
+    h = len(levels[0])
+    w = len(levels[0][0])
+    out = bytearray(MAGIC)
+    out += bytes((w, h, len(levels) & 0xFF, len(levels) >> 8))
+    for rows in levels:
+        if len(rows) != h or len(rows[0]) != w:
+            raise ValueError("all levels must be %dx%d" % (w, h))
+        out += pack_level(rows)
+    return bytes(out)
+
+
+def unpack(level):
+    # Level -> 타일 리스트의 리스트
+    return [level.row(y) for y in range(level.h)]
+
+
+def save(path, levels):
+    with open(path, "wb") as f:
+        f.write(pack(levels))
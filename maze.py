@@ -0,0 +1,87 @@
+# maze.py
+# 미로 게임 맵 그리기 (타일 아틀라스 + 줄 단위 묶음 전송)
+# 맵 타일: 0 바닥, 1 벽, 2 시작, 3 도착
+
+TILE_SIZE = 11
+MAP_W = 14
+MAP_H = 11
+
+FLOOR = 0
+WALL = 1
+START = 2
+GOAL = 3
+
+
+class MazeRenderer(object):
+    def __init__(self, tft, floor, wall_edge, wall_face, start, goal):
+        self.tft = tft
+        T = TILE_SIZE
+        self._width = MAP_W * T
+        line = self._width * 2
+
+        # 아틀라스: 타일 종류별로 "타일 한 줄(1px)을 맵 가로 전체만큼 반복한 줄" T개
+        # 같은 종류가 k칸 이어지면 각 줄의 앞쪽 k*T 픽셀을 그대로 복사하면 됨
+        self._atlas = []
+        for kind in (FLOOR, WALL, START, GOAL):
+            if kind == WALL:
+                # 테두리가 있는 벽 타일을 한 번만 그려둠
+                lines = []
+                for j in range(T):
+                    edge = j == 0 or j == T - 1
+                    buf = bytearray(line)
+                    for x in range(MAP_W * T):
+                        tx = x % T
+                        c = wall_edge if edge or tx == 0 or tx == T - 1 else wall_face
+                        buf[x * 2] = c >> 8
+                        buf[x * 2 + 1] = c & 0xFF
+                    lines.append(memoryview(buf))
+            else:
+                c = (floor, 0, start, goal)[kind]
+                buf = bytearray(line)
+                for x in range(MAP_W * T):
+                    buf[x * 2] = c >> 8
+                    buf[x * 2 + 1] = c & 0xFF
+                lines = [memoryview(buf)] * T
+            self._atlas.append(lines)
+
+        # 맵 한 줄(타일 높이 T, 가로 MAP_W 타일) 분량 RGB565 버퍼
+        self._row = memoryview(bytearray(line * T))
+
+    def _runs(self, row):
+        # 같은 타일이 이어지는 구간: (종류, 시작 칸, 길이)
+        runs = []
+        x = 0
+        while x < MAP_W:
+            kind = row[x]
+            n = 1
+            while x + n < MAP_W and row[x + n] == kind:
+                n += 1
+            runs.append((kind, x, n))
+            x += n
+        return runs
+
+    def draw(self, level, background=0):
+        # 맵 한 줄을 버퍼에 조립해서 창 하나로 전송 -> 레벨 로딩이 MAP_H번의 전송
+        # level: levels.Level
+        tft = self.tft
+        T = TILE_SIZE
+        line = self._width * 2
+        buf = self._row
+        for ty in range(MAP_H):
+            for kind, x, n in self._runs(level.row(ty)):
+                o = x * T * 2
+                k = n * T * 2
+                src = self._atlas[kind]
+                p = o
+                for j in range(T):
+                    buf[p:p + k] = src[j][:k]
+                    p += line
+            tft.blit(buf, 0, ty * T, self._width, T)
+
+        # 맵 밖 오른쪽/아래쪽 여백만 따로 지움
+        w = tft.width_limit
+        h = tft.height_limit
+        if w > self._width:
+            tft.fillrect(self._width, 0, w - self._width, MAP_H * T, background)
+        if h > MAP_H * T:
+            tft.fillrect(0, MAP_H * T, w, h - MAP_H * T, background)
@@ -0,0 +1,90 @@
+# mazegen.py
+# 시드로 미로 레벨 만들기 (타일: 0 바닥, 1 벽, 2 시작, 3 도착)
+#
+# 홀수 좌표 칸들을 스택 방식 백트래킹으로 뚫음 (재귀 없음, 스택은 칸 수만큼이 최대)
+# 도착 칸에서 출발해 뚫으므로 길이 하나뿐인 미로(트리)가 되고,
+# 뚫는 동안 기록한 깊이가 곧 도착까지의 최단 거리(BFS 거리와 같음)
+#   -> 가장 먼 칸을 시작으로 두면 항상 풀 수 있고, 그 거리가 난이도
+# 난수는 16비트 xorshift: 보드와 PC에서 같은 시드면 같은 미로, 큰 정수 할당 없음
+from maze import MAP_W, MAP_H, FLOOR, WALL, START, GOAL
+from levels import Level, pack_level
+
+UNREACHED = 0xFF
+
+# 칸 사이 이동 (2타일씩)
+_DIRS = ((2, 0), (-2, 0), (0, 2), (0, -2))
+
+
+class Rng(object):
+    def __init__(self, seed):
+        self.s = (seed & 0xFFFF) or 0xACE1
+
+    def next(self):
+        s = self.s
+        s ^= (s << 7) & 0xFFFF
+        s ^= s >> 9
+        s ^= (s << 8) & 0xFFFF
+        self.s = s
+        return s
+
+    def below(self, n):
+        return self.next() % n
+
+
+def generate(seed, w=MAP_W, h=MAP_H):
+    # -> (타일 리스트의 리스트, 거리 bytearray(w*h, 도착에서 타일 단위, 벽은 UNREACHED), 시작까지 거리)
+    rng = Rng(seed)
+    rows = [[WALL] * w for _ in range(h)]
+    dist = bytearray(b"\xff" * (w * h))
+
+    # 칸 좌표: 1, 3, 5, ... (테두리와 짝수 줄/열은 벽)
+    # 뚫는 영역(mw x mh)은 홀수 폭/높이: 짝수면 마지막 열/줄을 빼고 그 열/줄은 벽으로 남김
+    #   기본 맵(14 x 11)은 0~12열에 미로, 13열은 화면 폭에 맞춘 여분의 벽 열 (오른쪽 테두리만 두 겹)
+    mw = w - 1 + (w & 1)
+    mh = h - 1 + (h & 1)
+    cw = (mw - 1) // 2
+    ch = (mh - 1) // 2
+    gx = 1 + 2 * rng.below(cw)
+    gy = 1 + 2 * rng.below(ch)
+    rows[gy][gx] = FLOOR
+    dist[gy * w + gx] = 0
+    far = (gx, gy)
+    far_d = 0
+
+    stack = [(gx, gy)]
+    dirs = [0, 1, 2, 3]
+    while stack:
+        x, y = stack[-1]
+        d = dist[y * w + x]
+        # 네 방향을 섞어서 아직 안 뚫은 칸 하나로 (없으면 되돌아감)
+        for i in range(3, 0, -1):
+            j = rng.below(i + 1)
+            dirs[i], dirs[j] = dirs[j], dirs[i]
+        for k in dirs:
+            dx, dy = _DIRS[k]
+            nx = x + dx
+            ny = y + dy
+            if 0 < nx < mw - 1 and 0 < ny < mh - 1 and rows[ny][nx] == WALL:
+                mx = x + dx // 2
+                my = y + dy // 2
+                rows[my][mx] = FLOOR
+                rows[ny][nx] = FLOOR
+                dist[my * w + mx] = d + 1
+                dist[ny * w + nx] = d + 2
+                if d + 2 > far_d:
+                    far_d = d + 2
+                    far = (nx, ny)
+                stack.append((nx, ny))
+                break
+        else:
+            stack.pop()
+
+    rows[gy][gx] = GOAL
+    rows[far[1]][far[0]] = START
+    return rows, dist, far_d
+
+
+def level(seed, w=MAP_W, h=MAP_H):
+    # 게임에서 바로 쓰는 levels.Level
+    rows = generate(seed, w, h)[0]
+    return Level(w, h, memoryview(pack_level(rows)))
@@ -0,0 +1,86 @@
+# mazephys.py
+# 미로 이동/충돌: 줄마다 벽 비트마스크를 만들어 두고 정수 연산만으로 검사 (리스트/튜플 할당 없음)
+# 가로/세로를 따로 처리해서 대각선으로 벽에 닿으면 막힌 쪽만 멈추고 다른 쪽으로 미끄러짐
+from maze import TILE_SIZE, MAP_W, MAP_H, WALL, GOAL
+
+
+class MazePhysics(object):
+    def __init__(self, width, height):
+        # width, height: 플레이어가 움직일 수 있는 화면 크기 (맵 밖 여백도 포함)
+        self.width = width
+        self.height = height
+        self._walls = [0] * MAP_H   # 줄마다 벽 타일 비트 (비트 x = x번째 칸)
+        self._goals = [0] * MAP_H
+
+    def load(self, level):
+        # levels.Level 에서 벽/도착 비트마스크를 만듦 (레벨마다 한 번)
+        for y in range(MAP_H):
+            w = 0
+            g = 0
+            for x in range(MAP_W):
+                t = level.tile(x, y)
+                if t == WALL:
+                    w |= 1 << x
+                elif t == GOAL:
+                    g |= 1 << x
+            self._walls[y] = w
+            self._goals[y] = g
+
+    def _overlap(self, masks, x, y, w, h):
+        # (x, y, w, h) 사각형이 덮는 칸 중 masks에 표시된 칸이 있는지 (맵 밖은 빈 칸)
+        T = TILE_SIZE
+        bits = (2 << ((x + w - 1) // T)) - (1 << (x // T))
+        ty = y // T
+        ty1 = (y + h - 1) // T
+        if ty1 >= MAP_H:
+            ty1 = MAP_H - 1
+        while ty <= ty1:
+            if masks[ty] & bits:
+                return True
+            ty += 1
+        return False
+
+    def blocked(self, x, y, w, h):
+        return self._overlap(self._walls, x, y, w, h)
+
+    def at_goal(self, x, y, w, h):
+        return self._overlap(self._goals, x, y, w, h)
+
+    def move(self, x, y, w, h, dx, dy):
+        # 대각선 목표가 막혔으면 가로 먼저, 그다음 세로로 이동 -> (새 x, 새 y, 벽에 막혔는지)
+        # 막힌 축은 벽 바로 앞까지만 이동
+        T = TILE_SIZE
+        hit = False
+        if dx and dy:
+            # 대각선 목표가 비어 있으면 그대로 (모서리를 스치는 이동도 예전처럼 허용)
+            nx = min(max(x + dx, 0), self.width - w)
+            ny = min(max(y + dy, 0), self.height - h)
+            if not self.blocked(nx, ny, w, h):
+                return nx, ny, False
+        if dx:
+            nx = x + dx
+            if nx < 0: nx = 0
+            if nx > self.width - w: nx = self.width - w
+            if self.blocked(nx, y, w, h):
+                hit = True
+                if dx > 0:
+                    nx = (x + w - 1 + dx) // T * T - w
+                    if nx < x: nx = x
+                else:
+                    nx = ((x + dx) // T + 1) * T
+                    if nx > x: nx = x
+            x = nx
+        if dy:
+            ny = y + dy
+            if ny < 0: ny = 0
+            if ny > self.height - h: ny = self.height - h
+            if self.blocked(x, ny, w, h):
+                hit = True
+                if dy > 0:
+                    ny = (y + h - 1 + dy) // T * T - h
+                    if ny < y: ny = y
+                else:
+                    ny = ((y + dy) // T + 1) * T
+                    if ny > y: ny = y
+            y = ny
+        return x, y, hit
@@ -0,0 +1,87 @@
+# menu.py
+# 세로로 쌓인 카드 메뉴 (유지형: 한 번 그린 내용은 다시 그리지 않음)
+#
+# draw(): 화면을 지우고 카드 테두리 + 내용을 모두 그림 (메뉴에 처음 들어올 때, 게임에서 돌아올 때)
+# select()/move(): 이전 카드와 새 카드의 테두리(border 두께 변 4개씩)만 색을 바꿔 다시 그림
+#   -> 항목이 몇 개든 키 한 번에 보내는 양은 같음
+# 프레임버퍼 모드에서는 변마다 flush: 더티 사각형이 합쳐져 카드 전체가 전송되지 않도록
+# 항목이 화면(tft.height_limit)에 다 들어가지 않으면 들어가는 만큼만 보여주고,
+#   선택이 보이는 범위를 벗어나면 범위를 옮겨서 draw()로 다시 그림
+
+
+class Menu(object):
+    def __init__(self, tft, items, x, y, w, h, gap, on, off, bg=0x0000, border=2):
+        # items: 카드마다 내용을 그리는 함수 f(x, y) (카드 왼쪽 위 좌표를 받음)
+        # 화면의 k번째 카드 위치: (x, y + k * (h + gap)), 크기 w x h
+        self._tft = tft
+        self.items = items
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.gap = gap
+        self.on = on
+        self.off = off
+        self.bg = bg
+        self.border = border
+        self.selected = 0
+        self.top = 0        # 화면 맨 위 카드의 항목 번호
+
+    def visible(self):
+        # 화면에 한 번에 들어가는 카드 수 (회전에 따라 다르므로 그릴 때마다 계산)
+        n = (self._tft.height_limit - self.y + self.gap) // (self.h + self.gap)
+        return max(1, min(n, len(self.items)))
+
+    def card(self, i):
+        # 항목 i 카드의 왼쪽 위 좌표 (보이는 범위 안의 항목만)
+        return self.x, self.y + (i - self.top) * (self.h + self.gap)
+
+    def _frame(self, i, color):
+        # 카드 i의 테두리만 color로 (변 하나 그릴 때마다 flush)
+        tft = self._tft
+        x, y = self.card(i)
+        w = self.w
+        h = self.h
+        b = self.border
+        tft.fillrect(x, y, w, b, color)
+        tft.flush()
+        tft.fillrect(x, y + h - b, w, b, color)
+        tft.flush()
+        tft.fillrect(x, y + b, b, h - 2 * b, color)
+        tft.flush()
+        tft.fillrect(x + w - b, y + b, b, h - 2 * b, color)
+        tft.flush()
+
+    def draw(self):
+        tft = self._tft
+        b = self.border
+        with tft.section("menu"):
+            tft.fill(self.bg)
+            for i in range(self.top, self.top + self.visible()):
+                x, y = self.card(i)
+                tft.fillrect(x, y, self.w, self.h, self.on if i == self.selected else self.off)
+                tft.fillrect(x + b, y + b, self.w - 2 * b, self.h - 2 * b, self.bg)
+                self.items[i](x, y)
+            tft.flush()
+
+    def select(self, i):
+        # 선택 바꾸기 (범위 밖이면 끝으로 맞춤), 바뀌었으면 True
+        if i < 0: i = 0
+        if i >= len(self.items): i = len(self.items) - 1
+        if i == self.selected:
+            return False
+        n = self.visible()
+        if i < self.top or i >= self.top + n:
+            # 보이는 범위 밖: 범위를 옮기고 전체를 다시 그림
+            self.top = i if i < self.top else i - n + 1
+            self.selected = i
+            self.draw()
+            return True
+        with self._tft.section("menu"):
+            self._frame(self.selected, self.off)
+            self._frame(i, self.on)
+        self.selected = i
+        return True
+
+    def move(self, d):
+        return self.select(self.selected + d)
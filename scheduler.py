@@ -0,0 +1,110 @@
+# scheduler.py
+# 고정 주기 게임 루프 + 프레임 시간 기록
+#
+# 한 프레임 = begin() -> (업데이트) -> rendering() -> (그리기) -> end(flush)
+#   end()는 flush(SPI 전송) 시간을 따로 재고, 주기에서 남은 시간만큼만 잠
+#   begin()은 다음 프레임 시각이 이미 지났으면(루프가 쉬다 다시 시작) 지금으로 다시 잡음
+#   -> 쉬고 난 첫 프레임이 늦은 프레임(overruns)으로 세어지거나 잠을 건너뛰지 않음
+# "spi"는 메인 루프가 flush()에 묶여 있던 시간: 비동기 flush(TFT.async_flush)면 전송 버퍼 복사
+#   (+ 앞 전송이 버퍼를 비울 때까지 기다린 시간)만 들어가고 실제 전송은 전송 스레드에서 일어남
+#   전송 시간 자체는 SPI 프로파일러(TFT.profile, 비동기 flush를 끔)로 잼
+# 최근 프레임들의 업데이트/그리기/SPI 시간(us)을 링버퍼에 남겨두고 report()로 통계 출력
+from clock import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_ms
+
+
+class FrameScheduler(object):
+    def __init__(self, period_ms, history=64):
+        self.period_ms = period_ms
+        self._next = ticks_ms()
+        self._t0 = 0
+        self._t1 = 0
+
+        # 항목별 링버퍼 (마이크로초)
+        self._n = history
+        self._i = 0
+        self._count = 0
+        self._update = [0] * history
+        self._render = [0] * history
+        self._spi = [0] * history
+        self._frame = [0] * history
+        self.overruns = 0
+
+    def begin(self):
+        now = ticks_ms()
+        if ticks_diff(now, self._next) > 0:
+            self._next = now
+        self._t0 = ticks_us()
+        self._t1 = self._t0
+
+    def rendering(self):
+        # 업데이트가 끝나고 그리기 시작
+        self._t1 = ticks_us()
+
+    def end(self, flush=None):
+        t2 = ticks_us()
+        if flush is not None:
+            flush()
+        t3 = ticks_us()
+
+        i = self._i
+        self._update[i] = ticks_diff(self._t1, self._t0)
+        self._render[i] = ticks_diff(t2, self._t1)
+        self._spi[i] = ticks_diff(t3, t2)
+        self._frame[i] = ticks_diff(t3, self._t0)
+        self._i = (i + 1) % self._n
+        if self._count < self._n:
+            self._count += 1
+
+        # 다음 프레임 시각까지 남은 시간만 잠 (이미 늦었으면 밀린 프레임은 버리고 기준을 다시 잡음)
+        self._next = ticks_add(self._next, self.period_ms)
+        wait = ticks_diff(self._next, ticks_ms())
+        if wait > 0:
+            sleep_ms(wait)
+        else:
+            if wait < 0:
+                self.overruns += 1
+            self._next = ticks_ms()
+
+    def run(self, update, render, flush=None):
+        # update()가 False를 돌려줄 때까지 고정 주기로 반복
+        self._next = ticks_ms()
+        while True:
+            self.begin()
+            running = update()
+            self.rendering()
+            render()
+            self.end(flush)
+            if not running:
+                return
+
+    def reset(self):
+        self._i = 0
+        self._count = 0
+        self.overruns = 0
+        self._next = ticks_ms()
+
+    def _summary(self, data):
+        # (최소, 평균, 95퍼센타일) 마이크로초
+        n = self._count
+        if n == 0:
+            return 0, 0, 0
+        vals = sorted(data[:n])
+        return vals[0], sum(vals) // n, vals[(n * 95 - 1) // 100]
+
+    def stats(self):
+        return {
+            "update": self._summary(self._update),
+            "render": self._summary(self._render),
+            "spi": self._summary(self._spi),
+            "frame": self._summary(self._frame),
+            "frames": self._count,
+            "overruns": self.overruns,
+        }
+
+    def report(self):
+        s = self.stats()
+        print("프레임 %d개 (주기 %d ms, 초과 %d회)" % (s["frames"], self.period_ms, s["overruns"]))
+        print("         최소     평균      p95  (us)")
+        for key in ("update", "render", "spi", "frame"):
+            lo, avg, p95 = s[key]
+            print("  %-6s %6d   %6d   %6d" % (key, lo, avg, p95))
@@ -0,0 +1,126 @@
+# spiflush.py
+# 프레임버퍼 flush를 별도 스레드에서 SPI로 보내는 2중 버퍼 파이프라인
+#
+# flush()는 바뀐 사각형을 전송 버퍼 두 개 중 하나에 복사(메모리 복사라 빠름)해서 넘기고 바로 돌아옴
+# 전송 스레드가 한쪽 버퍼를 보내는 동안 메인 루프는 다른 쪽 버퍼를 채우거나 다음 프레임을 그림
+# 복사본을 보내므로 flush 뒤에 프레임버퍼를 바로 고쳐도 화면이 깨지지 않음
+#
+# fence(): 지금까지 넘긴 전송이 모두 끝날 때까지 기다림
+#   화면에 직접 그리는 함수(fillrect/blit/pixel 직접 모드, rotation 등)는 TFT에서 먼저 fence를 부름
+#
+# 보드(MicroPython)와 PC(CPython) 모두 _thread 모듈을 씀
+import _thread
+
+
+class FlushPipeline(object):
+    def __init__(self, tft, size=4096):
+        # size: 전송 버퍼 하나의 크기 (화면 한 줄 = 폭*2 바이트 이상)
+        self._tft = tft
+        self._bufs = (bytearray(size), bytearray(size))
+        self._views = (memoryview(self._bufs[0]), memoryview(self._bufs[1]))
+        self._jobs = ([], [])   # 슬롯별 (창 또는 None, 시작, 끝) - 창이 None이면 이전 창에 이어서 씀
+
+        # free[i]: 메인이 슬롯 i를 채우는 동안/전송 중에 잠김 (전송 스레드가 다 보내면 풀어줌)
+        # ready[i]: 메인이 슬롯 i를 다 채우면 풀어서 전송 스레드를 깨움
+        self._free = (_thread.allocate_lock(), _thread.allocate_lock())
+        self._ready = (_thread.allocate_lock(), _thread.allocate_lock())
+        self._ready[0].acquire()
+        self._ready[1].acquire()
+
+        self._slot = 0          # 메인이 다음에 채울 슬롯 (전송 스레드도 같은 순서로 돎)
+        self._open = False      # 메인이 지금 슬롯을 잡고 채우는 중인지
+        self._used = 0
+        self.submitted = 0
+        self.done = 0
+
+        _thread.start_new_thread(self._run, ())
+
+    def _run(self):
+        # 전송 스레드: 슬롯 0, 1을 번갈아 기다렸다가 보냄
+        tft = self._tft
+        i = 0
+        while True:
+            self._ready[i].acquire()
+            jobs = self._jobs[i]
+            if jobs is None:
+                self._free[i].release()
+                return
+            buf = self._views[i]
+            for win, a, b in jobs:
+                if win is not None:
+                    tft._set_window(win[0], win[1], win[2], win[3])
+                tft._writeBlock(buf[a:b])
+            self.done += 1
+            self._free[i].release()
+            i ^= 1
+
+    def _take(self):
+        # 현재 슬롯을 잡음 (이 슬롯의 이전 전송이 아직이면 끝날 때까지 기다림)
+        i = self._slot
+        self._free[i].acquire()
+        self._jobs[i][:] = []
+        self._used = 0
+        self._open = True
+
+    def _submit(self):
+        if not self._open:
+            return
+        i = self._slot
+        self._open = False
+        if not self._jobs[i]:
+            self._free[i].release()
+            return
+        self.submitted += 1
+        self._slot = i ^ 1
+        self._ready[i].release()
+
+    def flush(self, fb, width, rects):
+        # rects: (x0, y0, x1, y1) 리스트, fb: width 폭의 RGB565 프레임버퍼
+        stride = width * 2
+        for x0, y0, x1, y1 in rects:
+            n = (x1 - x0 + 1) * 2
+            o = (y0 * width + x0) * 2
+            rows = y1 - y0 + 1
+            win = (x0, y0, x1, y1)
+            while rows:
+                if not self._open:
+                    self._take()
+                buf = self._views[self._slot]
+                p = self._used
+                k = min(rows, (len(buf) - p) // n)
+                if k == 0:
+                    # 한 줄도 안 들어가면 이 슬롯은 보내고 다음 슬롯에 이어서
+                    self._submit()
+                    continue
+                start = p
+                if n == stride:
+                    buf[p:p + n * k] = fb[o:o + n * k]
+                    o += n * k
+                else:
+                    for _ in range(k):
+                        buf[p:p + n] = fb[o:o + n]
+                        p += n
+                        o += stride
+                self._used = start + n * k
+                self._jobs[self._slot].append((win, start, self._used))
+                win = None
+                rows -= k
+        self._submit()
+
+    def busy(self):
+        return self.done != self.submitted
+
+    def fence(self):
+        # 넘긴 전송이 모두 끝날 때까지 기다림
+        for lock in self._free:
+            lock.acquire()
+            lock.release()
+
+    def close(self):
+        # 남은 전송을 끝내고 전송 스레드를 멈춤
+        self.fence()
+        i = self._slot
+        self._free[i].acquire()
+        self._jobs = (None, None)
+        self._ready[i].release()
+        self._free[i].acquire()
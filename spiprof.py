@@ -0,0 +1,89 @@
+# spiprof.py
+# SPI 비용을 구간(태그)별로 모으는 프로파일러 (TFT.profile()로 켬)
+#
+# 켜면 TFT 인스턴스의 _write/_set_window를 세는 함수로 바꿔 끼우고, 끄면 지워서 원래 메서드로 돌아감
+#   -> 꺼져 있을 때 그리기 경로에 추가 비용 없음
+# 태그: with tft.section("aim"): ... 블록 안의 창 설정 횟수, 전송 바이트, SPI 전송 시간(us)
+#   블록 밖의 전송은 "-" 태그로, 블록은 겹쳐도 됨 (안쪽 태그로 셈)
+# 프로파일 중에는 비동기 flush를 끔 (전송이 전송 스레드에서 나중에 일어나면 태그를 알 수 없음)
+from clock import ticks_us, ticks_diff
+
+OTHER = "-"
+
+
+class SpiProfiler(object):
+    def __init__(self, tft):
+        self._tft = tft
+        self._stats = {}    # 태그 -> [구간 수, 창 설정, 바이트, SPI us]
+        self._cur = self._entry(OTHER)
+        self._stack = []
+        self._pending = OTHER
+
+        # 비동기 flush를 잠시 끄고 (close에서 되돌림) 전송 함수를 바꿔 끼움
+        self._async = 0     # 켜져 있던 비동기 flush의 버퍼 크기
+        if tft._pipe is not None:
+            self._async = len(tft._pipe._bufs[0])
+            tft.async_flush(False)
+        write = tft._write
+        set_window = tft._set_window
+
+        def _write(data):
+            t0 = ticks_us()
+            write(data)
+            s = self._cur
+            s[2] += len(data)
+            s[3] += ticks_diff(ticks_us(), t0)
+
+        def _set_window(x0, y0, x1, y1):
+            self._cur[1] += 1
+            set_window(x0, y0, x1, y1)
+
+        tft._write = _write
+        tft._set_window = _set_window
+
+    def _entry(self, tag):
+        s = self._stats.get(tag)
+        if s is None:
+            s = [0, 0, 0, 0]
+            self._stats[tag] = s
+        return s
+
+    def section(self, tag):
+        self._pending = tag
+        return self
+
+    def __enter__(self):
+        self._stack.append(self._cur)
+        self._cur = self._entry(self._pending)
+        self._cur[0] += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._cur = self._stack.pop()
+        return False
+
+    def reset(self):
+        self._stats = {}
+        self._cur = self._entry(OTHER)
+        self._stack = []
+
+    def stats(self):
+        # 태그 -> (구간 수, 창 설정, 바이트, SPI us)
+        return dict((k, tuple(v)) for k, v in self._stats.items())
+
+    def report(self):
+        # SPI 시간이 긴 태그부터
+        rows = sorted(self._stats.items(), key=lambda kv: (kv[1][3], kv[1][2]), reverse=True)
+        total = sum(v[3] for k, v in rows) or 1
+        print("SPI 프로파일 (태그별)")
+        print("  태그           구간     창    바이트    SPI us     %")
+        for tag, (calls, windows, nbytes, us) in rows:
+            if windows or nbytes:
+                print("  %-12s %6d %6d %9d %9d %5.1f" % (tag, calls, windows, nbytes, us, us * 100.0 / total))
+
+    def close(self):
+        tft = self._tft
+        del tft._write
+        del tft._set_window
+        if self._async:
+            tft.async_flush(True, self._async)
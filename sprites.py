@@ -0,0 +1,51 @@
+# sprites.py
+# 미리 그려둔 RGB565 스프라이트 (TFT.blit으로 창 하나에 전송)
+#
+# 버블 하나를 fillcircle + 하이라이트로 그리면 창 설정이 여러 번 (반지름 5: 원 6번 + 하이라이트 1번)
+# 색마다 (2r+1) x (2r+1) 사각형 버퍼에 원과 하이라이트를 한 번만 그려두고 blit 한 번으로 보냄
+# 사각형의 원 바깥(모서리)은 배경색으로 덮으므로, 다른 그림과 사각형이 겹치지 않는 곳에서만 씀
+#   (버블 격자는 칸 간격 14/12픽셀 > 지름 11픽셀이라 겹치지 않음)
+from st7735 import circle_spans
+
+
+def bubble_sprite(r, color, bg, highlight):
+    # 반지름 r 버블 -> RGB565 버퍼 (가로=세로=2r+1, 줄 순서)
+    # 모양은 game.draw_circle과 같음: 원 + 중심에서 왼쪽 위 (r+1)//2 지점의 2x2 하이라이트
+    size = 2 * r + 1
+    buf = bytearray(size * size * 2)
+    t = circle_spans(r)
+    for y in range(size):
+        hw = t[abs(y - r)]
+        for x in range(size):
+            c = color if abs(x - r) <= hw else bg
+            o = (y * size + x) * 2
+            buf[o] = c >> 8
+            buf[o + 1] = c & 0xFF
+    if color != bg:
+        h = r - ((r + 1) >> 1)
+        for y in (h, h + 1):
+            for x in (h, h + 1):
+                o = (y * size + x) * 2
+                buf[o] = highlight >> 8
+                buf[o + 1] = highlight & 0xFF
+    return buf
+
+
+class BubbleSprites(object):
+    # palette의 색 번호별 버블 스프라이트 (시작할 때 한 번 만듦, 반지름 5면 색마다 242바이트)
+    def __init__(self, tft, r, palette, bg=0x0000, highlight=0xFFFF):
+        self._tft = tft
+        self.r = r
+        self.size = 2 * r + 1
+        self.bg = bg
+        self._sprites = [bubble_sprite(r, c, bg, highlight) for c in palette]
+
+    def draw(self, x, y, v):
+        # 중심 (x, y)에 색 번호 v 버블 (창 1번)
+        s = self.size
+        self._tft.blit(self._sprites[v], x - self.r, y - self.r, s, s)
+
+    def erase(self, x, y):
+        # 버블이 차지하던 사각형을 배경색으로 (창 1번)
+        s = self.size
+        self._tft.fillrect(x - self.r, y - self.r, s, s, self.bg)
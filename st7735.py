@@ -1,5 +1,6 @@
 import time
 from machine import SPI, Pin
+import sysfont
 
 # 명령 상수 (기존과 동일)
 SWRESET = 0x01
@@ -10,6 +11,8 @@ CASET = 0x2A
 RASET = 0x2B
 RAMWR = 0x2C
 MADCTL = 0x36
+VSCRDEF = 0x33
+VSCRSADR = 0x37
 COLMOD = 0x3A
 
 # 색상 상수
@@ -23,8 +26,109 @@ YELLOW = 0xFFE0
 WHITE = 0xFFFF
 PINK = 0xF810
 
+# 패널 프로필: 회전 0(세로) 기준 (가로, 세로, colstart, rowstart)
+PANEL_128x160 = (128, 160, 0, 0)
+PANEL_132x160 = (132, 160, 0, 0)  # 게임 화면 (가로로 돌려서 160x132로 씀)
+
+# 회전별 MADCTL 값 (0: 세로, 1: 가로, 2: 세로 180도, 3: 가로 180도)
+# 1, 3은 MV 비트로 가로/세로가 바뀜
+MADCTL_ROTATION = (0xC0, 0xA0, 0x00, 0x60)
+
+# 초기화 표 (바이트열): 명령, 정보 바이트, 파라미터..., [기다릴 ms]
+#   정보 바이트 = 파라미터 수 | INIT_DELAY(기다림 바이트가 뒤따름) | INIT_COLD(웜 스타트에서는 건너뜀)
+# 기다림은 데이터시트 최소값: 하드웨어 리셋 뒤 SLPOUT까지 120ms, SLPOUT 뒤 120ms
+# (하드웨어 리셋을 하므로 SWRESET은 보내지 않음, 나머지 명령은 기다림 없이 CS 한 번에 이어서 보냄)
+INIT_DELAY = 0x80
+INIT_COLD = 0x40
+INIT_SEQUENCE = bytes((
+    SLPOUT, INIT_COLD | INIT_DELAY, 120,
+    COLMOD, 1, 0x05,                # 색상 모드 16bit
+    MADCTL, 1, 0xC0,                # 화면 방향 기본값 (회전 0)
+    NORON, 0,
+    DISPON, 0,
+))
+RESET_PULSE_MS = 1      # 리셋 핀 LOW 유지 (최소 10us)
+RESET_WAIT_MS = 120     # 리셋 해제 뒤 SLPOUT까지
+
+# fillrect 분할 전송 크기 (픽셀 수)
+CHUNK_PIXELS = 1024
+
+# 프레임버퍼 모드에서 따로 관리할 더티 사각형 최대 개수 (넘으면 하나로 합침)
+MAX_DIRTY = 8
+
+# text()로 그린 문자열 비트맵을 기억해 둘 개수 (가장 오래 안 쓴 것부터 버림)
+TEXT_CACHE = 8
+
+# 반지름별 원 반폭 테이블 캐시 (게임에서 쓰는 반지름은 몇 개뿐이라 한 번만 계산)
+_circle_spans = {}
+
+def circle_spans(r):
+    # t[dy] = 중심에서 dy만큼 떨어진 줄의 반폭 (dx*dx + dy*dy <= r*r 인 최대 dx)
+    t = _circle_spans.get(r)
+    if t is None:
+        t = bytearray(r + 1)
+        rr = r * r
+        hw = r
+        for dy in range(r + 1):
+            while hw * hw > rr - dy * dy:
+                hw -= 1
+            t[dy] = hw
+        _circle_spans[r] = t
+    return t
+
+def _render_text(s, fg, bg, scale):
+    # 문자열을 RGB565 버퍼 하나에 그림 -> (버퍼, 가로, 세로)
+    font = sysfont.FONT
+    W = sysfont.WIDTH
+    n = len(s)
+    if n == 0:
+        return bytearray(0), 0, 0
+    w = (n * (W + 1) - 1) * scale
+    h = sysfont.HEIGHT * scale
+    buf = bytearray(w * h * 2)
+    # 배경색을 먼저 채움 (2배씩 복사)
+    buf[0] = bg >> 8
+    buf[1] = bg & 0xFF
+    k = 2
+    while k < len(buf):
+        c = min(k, len(buf) - k)
+        buf[k:k + c] = buf[:c]
+        k += c
+    # 글자색 한 칸(scale 픽셀) 조각
+    dot = bytearray(scale * 2)
+    for i in range(scale):
+        dot[2 * i] = fg >> 8
+        dot[2 * i + 1] = fg & 0xFF
+    stride = w * 2
+    x = 0
+    for ch in s:
+        o = sysfont.glyph(ch)
+        for col in range(W):
+            bits = font[o + col]
+            y = 0
+            while bits:
+                if bits & 1:
+                    p = (y * scale * w + x + col * scale) * 2
+                    for _ in range(scale):
+                        buf[p:p + scale * 2] = dot
+                        p += stride
+                bits >>= 1
+                y += 1
+        x += (W + 1) * scale
+    return buf, w, h
+
+class _NoSection(object):
+    # 프로파일이 꺼져 있을 때 section()이 돌려주는 빈 with 블록
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_SECTION = _NoSection()
+
 class TFT(object):
-    def __init__(self, spi, aDC, aReset, aCS):
+    def __init__(self, spi, aDC, aReset, aCS, aPanel=PANEL_128x160):
         self._spi = spi
         self._dc = aDC
         self._reset = aReset
@@ -33,54 +137,110 @@ class TFT(object):
         self._dc.value(0)
         self._reset.value(1)
         
-        # [중요] 오프셋 변수 추가 (여기서 화면 위치를 조절합니다)
-        self.colstart = 0 
-        self.rowstart = 0
+        # 회전별 (가로, 세로, colstart, rowstart) - 가로 모드에서는 크기와 오프셋이 서로 바뀜
+        w, h, cs, rs = aPanel
+        self._bounds = ((w, h, cs, rs), (h, w, rs, cs), (w, h, cs, rs), (h, w, rs, cs))
+
+        # [중요] 오프셋 (colstart, rowstart) 과 화면 크기 (클리핑 기준) - rotation()에서 바뀜
+        self.width_limit, self.height_limit, self.colstart, self.rowstart = self._bounds[0]
+
+        # 프레임버퍼 모드 (framebuffer()로 켬)
+        self._fb = None
+        self._dirty = []
+
+        # 비동기 flush 파이프라인 (async_flush()로 켬)
+        self._pipe = None
+
+        # SPI 프로파일러 (profile()로 켬)
+        self._prof = None
+
+        # 전송용 임시 버퍼 (호출마다 bytearray를 새로 만들지 않도록 미리 할당)
+        self._cmdbuf = bytearray(1)
+        self._parambuf = bytearray(4)
+        mv = memoryview(self._parambuf)
+        self._param1 = mv[:1]
+        self._param2 = mv[:2]
+
+        # fillrect용 색상 버퍼: 색이 바뀔 때 필요한 길이만큼만 다시 채움
+        self._colorbuf = memoryview(bytearray(CHUNK_PIXELS * 2))
+        self._color = -1
+        self._colorlen = 0
+
+        # text() 캐시: (문자열, 글자색, 배경색, 배율) -> (버퍼, 가로, 세로), 키 순서 = 최근 사용 순
+        self._text_cache = {}
+        self._text_order = []
 
     def _write(self, aData):
         self._spi.write(aData)
 
     def _writeCmd(self, aCmd):
+        self._cmdbuf[0] = aCmd
         self._dc.value(0)
         self._cs.value(0)
-        self._write(bytearray([aCmd]))
+        self._write(self._cmdbuf)
         self._cs.value(1)
 
     def _writeData(self, aData):
+        self._cmdbuf[0] = aData
         self._dc.value(1)
         self._cs.value(0)
-        self._write(bytearray([aData]))
+        self._write(self._cmdbuf)
         self._cs.value(1)
 
+    def _writeCmdData(self, aCmd, aData):
+        # 명령 + 파라미터를 CS 한 번으로 전송 (중간에 DC만 전환)
+        self._cmdbuf[0] = aCmd
+        self._dc.value(0)
+        self._cs.value(0)
+        self._write(self._cmdbuf)
+        self._dc.value(1)
+        self._write(aData)
+        self._cs.value(1)
+
+    def _writeCmdByte(self, aCmd, aValue):
+        # 파라미터가 1바이트인 명령용
+        self._parambuf[0] = aValue
+        self._writeCmdData(aCmd, self._param1)
+
     def _writeBlock(self, aData):
         self._dc.value(1)
         self._cs.value(0)
         self._write(aData)
         self._cs.value(1)
 
-    def initr(self):
-        self._reset.value(0)
-        time.sleep_ms(50)
-        self._reset.value(1)
-        time.sleep_ms(50)
-        
-        self._writeCmd(SWRESET)
-        time.sleep_ms(150)
-        self._writeCmd(SLPOUT)
-        time.sleep_ms(255)
-        
-        # 색상 모드 (16bit)
-        self._writeCmd(COLMOD)
-        self._writeData(0x05)
-        
-        # 화면 방향 초기 설정
-        self._writeCmd(MADCTL)
-        self._writeData(0xC0) # 기본값
+    def initr(self, warm=False):
+        # warm=True: 패널이 이미 켜져 깨어 있을 때(소프트 리셋 등) 하드웨어 리셋과 SLPOUT을 건너뜀
+        if not warm:
+            self._reset.value(0)
+            time.sleep_ms(RESET_PULSE_MS)
+            self._reset.value(1)
+            time.sleep_ms(RESET_WAIT_MS)
 
-        self._writeCmd(NORON)
-        time.sleep_ms(10)
-        self._writeCmd(DISPON)
-        time.sleep_ms(100)
+        # 초기화 표를 차례로 전송 (기다림이 있는 곳에서만 CS를 올림)
+        seq = memoryview(INIT_SEQUENCE)
+        cmd = self._cmdbuf
+        i = 0
+        self._cs.value(0)
+        while i < len(seq):
+            info = seq[i + 1]
+            n = info & 0x1F
+            if warm and info & INIT_COLD:
+                i += 2 + n + (1 if info & INIT_DELAY else 0)
+                continue
+            cmd[0] = seq[i]
+            self._dc.value(0)
+            self._write(cmd)
+            i += 2
+            if n:
+                self._dc.value(1)
+                self._write(seq[i:i + n])
+                i += n
+            if info & INIT_DELAY:
+                self._cs.value(1)
+                time.sleep_ms(seq[i])
+                self._cs.value(0)
+                i += 1
+        self._cs.value(1)
 
     # [중요] 오프셋이 적용되도록 수정된 함수
     def _set_window(self, x0, y0, x1, y1):
@@ -90,64 +250,340 @@ class TFT(object):
         y0 += self.rowstart
         y1 += self.rowstart
         
-        self._writeCmd(CASET)
-        self._writeData(x0 >> 8)
-        self._writeData(x0 & 0xFF)
-        self._writeData(x1 >> 8)
-        self._writeData(x1 & 0xFF)
-        self._writeCmd(RASET)
-        self._writeData(y0 >> 8)
-        self._writeData(y0 & 0xFF)
-        self._writeData(y1 >> 8)
-        self._writeData(y1 & 0xFF)
+        # 명령마다 CS 한 번씩: CASET, RASET, RAMWR 세 번의 트랜잭션
+        buf = self._parambuf
+        buf[0] = x0 >> 8
+        buf[1] = x0 & 0xFF
+        buf[2] = x1 >> 8
+        buf[3] = x1 & 0xFF
+        self._writeCmdData(CASET, buf)
+        buf[0] = y0 >> 8
+        buf[1] = y0 & 0xFF
+        buf[2] = y1 >> 8
+        buf[3] = y1 & 0xFF
+        self._writeCmdData(RASET, buf)
         self._writeCmd(RAMWR)
 
     def fill(self, color):
-        # 128x160 전체 채우기
-        self.fillrect(0, 0, 128, 160, color)
+        # 화면 전체 채우기
+        self.fillrect(0, 0, self.width_limit, self.height_limit, color)
 
     def fillrect(self, x, y, w, h, color):
         # 화면 범위를 벗어나지 않게 클리핑
-        if x >= 128 or y >= 160: return
-        if x + w > 128: w = 128 - x
-        if y + h > 160: h = 160 - y
+        if x < 0: w += x; x = 0
+        if y < 0: h += y; y = 0
+        if x + w > self.width_limit: w = self.width_limit - x
+        if y + h > self.height_limit: h = self.height_limit - y
+        if w <= 0 or h <= 0: return
+
+        if self._fb is not None:
+            self._fb_fillrect(x, y, w, h, color)
+            return
+        if self._pipe is not None:
+            self._pipe.fence()
         
         self._set_window(x, y, x + w - 1, y + h - 1)
         
-        high = color >> 8
-        low = color & 0xFF
-        
-        # 메모리 부족 방지를 위한 분할 전송
-        pixel_count = w * h
-        chunk_size = 1024
-        buffer = bytearray([high, low] * chunk_size)
-        
-        for i in range(0, pixel_count, chunk_size):
-            pixels = min(chunk_size, pixel_count - i)
-            if pixels < chunk_size:
-                self._writeBlock(bytearray([high, low] * pixels))
-            else:
-                self._writeBlock(buffer)
-                
+        # 미리 할당한 색상 버퍼를 반복 전송 (새 bytearray 없음, 꼬리는 memoryview 슬라이스)
+        n = w * h * 2
+        buf = self._colorbuf
+        size = len(buf)
+        self._color_fill(color, min(n, size))
+        self._dc.value(1)
+        self._cs.value(0)
+        while n >= size:
+            self._write(buf)
+            n -= size
+        if n:
+            self._write(buf[:n])
+        self._cs.value(1)
+
+    def _color_fill(self, color, need):
+        # 앞쪽 need 바이트가 color로 채워져 있도록 보장 (이미 채운 부분을 2배씩 복사)
+        buf = self._colorbuf
+        if color != self._color:
+            self._color = color
+            buf[0] = color >> 8
+            buf[1] = color & 0xFF
+            self._colorlen = 2
+        k = self._colorlen
+        while k < need:
+            c = min(k, len(buf) - k)
+            buf[k:k + c] = buf[:c]
+            k += c
+        if k > self._colorlen:
+            self._colorlen = k
+
+
     def fillcircle(self, x, y, r, color):
-        for i in range(y - r, y + r + 1):
-            for j in range(x - r, x + r + 1):
-                if (j - x) ** 2 + (i - y) ** 2 <= r ** 2:
-                    self.pixel(j, i, color)
+        # 줄 단위로 채우되, 반폭이 같은 연속된 줄은 사각형 하나로 묶음
+        t = circle_spans(r)
+        i = -r
+        while i <= r:
+            hw = t[abs(i)]
+            j = i + 1
+            while j <= r and t[abs(j)] == hw:
+                j += 1
+            self.fillrect(x - hw, y + i, 2 * hw + 1, j - i, color)
+            i = j
+
+    def blit(self, buf, x, y, w, h):
+        # 미리 그려둔 RGB565 버퍼(w*h*2 바이트, 줄 순서)를 창 하나로 전송
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width_limit) - 1
+        y1 = min(y + h, self.height_limit) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        src = memoryview(buf)
+        stride = w * 2
+        n = (x1 - x0 + 1) * 2
+        o = ((y0 - y) * w + (x0 - x)) * 2
+        rows = y1 - y0 + 1
+        if self._fb is not None:
+            fb = self._fb
+            p = (y0 * self.width_limit + x0) * 2
+            fstride = self.width_limit * 2
+            for _ in range(rows):
+                fb[p:p + n] = src[o:o + n]
+                o += stride
+                p += fstride
+            self._mark_dirty(x0, y0, x1, y1)
+            return
+        if self._pipe is not None:
+            self._pipe.fence()
+        self._set_window(x0, y0, x1, y1)
+        self._dc.value(1)
+        self._cs.value(0)
+        if n == stride:
+            self._write(src[o:o + n * rows])
+        else:
+            for _ in range(rows):
+                self._write(src[o:o + n])
+                o += stride
+        self._cs.value(1)
+
+    def text(self, x, y, s, fg, bg=BLACK, scale=1):
+        # 5x7 글꼴로 문자열 출력 (글자 사이 1열 간격), 문자열 전체를 버퍼 하나에 그려 창 하나로 전송
+        # 같은 (문자열, 색, 배율)은 캐시된 비트맵을 그대로 다시 보냄, 그린 가로 폭을 반환
+        key = (s, fg, bg, scale)
+        hit = self._text_cache.get(key)
+        order = self._text_order
+        if hit is None:
+            hit = _render_text(s, fg, bg, scale)
+            if len(order) >= TEXT_CACHE:
+                del self._text_cache[order.pop(0)]
+            self._text_cache[key] = hit
+        else:
+            order.remove(key)
+        order.append(key)
+        buf, w, h = hit
+        self.blit(buf, x, y, w, h)
+        return w
 
     def pixel(self, x, y, color):
-        if 0 <= x < 128 and 0 <= y < 160:
+        if 0 <= x < self.width_limit and 0 <= y < self.height_limit:
+            if self._fb is not None:
+                o = (y * self.width_limit + x) * 2
+                self._fb[o] = color >> 8
+                self._fb[o + 1] = color & 0xFF
+                self._mark_dirty(x, y, x, y)
+                return
+            if self._pipe is not None:
+                self._pipe.fence()
             self._set_window(x, y, x, y)
-            self._writeData(color >> 8)
-            self._writeData(color & 0xFF)
+            buf = self._parambuf
+            buf[0] = color >> 8
+            buf[1] = color & 0xFF
+            self._writeBlock(self._param2)
             
     def rotation(self, m):
-        self._writeCmd(MADCTL)
-        # 회전 모드에 따라 값 설정
-        if m == 0: self._writeData(0xC0)
-        elif m == 1: self._writeData(0xA0)
-        elif m == 2: self._writeData(0x00)
-        elif m == 3: self._writeData(0x60)
+        # 회전 모드에 따라 MADCTL 과 클리핑 크기/오프셋 설정
+        m &= 3
+        self.fence()
+        self._writeCmdByte(MADCTL, MADCTL_ROTATION[m])
+        self.width_limit, self.height_limit, self.colstart, self.rowstart = self._bounds[m]
+        # 프레임버퍼는 크기(가로*세로)가 같으므로 그대로 쓰고 한 줄 폭만 바뀜
+        self._dirty = []
+
+    # ------------------------------------------
+    # 스크롤
+    # 패널 하드웨어 스크롤 (vscroll_area/vscroll): 메모리는 그대로 두고 보여주는 시작 줄만 바꿈
+    #   -> 몇 줄을 옮기든 명령 1번 (3바이트), 새로 드러난 줄만 그리면 됨
+    #   스크롤 축은 패널의 세로축(회전 0/2 화면의 세로) 고정: 가로 회전(1, 3)에서는 화면이 좌우로 움직임
+    # scroll(): 가로 회전에서 화면 세로로 옮길 때 쓰는 프레임버퍼 방식 (띠 전체를 다시 전송)
+    # ------------------------------------------
+    def vscroll_area(self, top, lines):
+        # 하드웨어 스크롤 영역 정의 (VSCRDEF): 위 고정 top줄, 스크롤 lines줄, 나머지는 아래 고정
+        # 줄은 패널 세로축(회전 0) 기준, 전송 중인 비동기 flush가 끝난 뒤에 보냄
+        bottom = self._bounds[0][1] - top - lines
+        self.fence()
+        self._writeCmdData(VSCRDEF, bytes((top >> 8, top & 0xFF, lines >> 8, lines & 0xFF,
+                                           bottom >> 8, bottom & 0xFF)))
+
+    def vscroll(self, start):
+        # 스크롤 영역 첫 줄에 보여줄 메모리 줄 (VSCRSADR, 명령 + 파라미터 2바이트)
+        # 그리기 좌표는 바뀌지 않으므로 새로 드러난 줄은 호출한 쪽에서 메모리 위치에 맞춰 그림
+        self.fence()
+        buf = self._parambuf
+        buf[0] = start >> 8
+        buf[1] = start & 0xFF
+        self._writeCmdData(VSCRSADR, self._param2)
+
+    def scroll(self, y0, y1, dy, color):
+        # 화면 줄 y0 ~ y1-1 띠를 dy줄 아래로 (음수면 위로) 옮기고 새로 드러난 줄은 color로 채움
+        # 프레임버퍼 안에서 dy줄 묶음씩 복사 (다시 그리지 않음), flush 때 띠 전체가 창 1번으로 전송
+        # 게임 화면(가로 회전)에서는 하드웨어 스크롤(vscroll) 축이 화면 가로라서 세로 이동은 이 방법으로 함
+        # 프레임버퍼가 없으면 화면을 읽을 수 없으므로 False (호출한 쪽에서 다시 그림)
+        if self._fb is None:
+            return False
+        if y0 < 0: y0 = 0
+        if y1 > self.height_limit: y1 = self.height_limit
+        n = y1 - y0
+        if n <= 0 or dy == 0:
+            return True
+        w = self.width_limit
+        if abs(dy) >= n:
+            self._fb_fillrect(0, y0, w, n, color)
+            return True
+        fb = self._fb
+        stride = w * 2
+        k = abs(dy) * stride
+        if dy > 0:
+            # 아래쪽 묶음부터 옮겨야 아직 안 옮긴 줄을 덮어쓰지 않음
+            o = y1 * stride - k
+            while o > y0 * stride:
+                s = max(o - k, y0 * stride)
+                fb[s + k:o + k] = fb[s:o]
+                o = s
+            self._fb_fillrect(0, y0, w, dy, color)
+        else:
+            o = y0 * stride + k
+            while o < y1 * stride:
+                e = min(o + k, y1 * stride)
+                fb[o - k:e - k] = fb[o:e]
+                o = e
+            self._fb_fillrect(0, y1 + dy, w, -dy, color)
+        self._mark_dirty(0, y0, w - 1, y1 - 1)
+        return True
         
+    # ------------------------------------------
+    # 프레임버퍼 모드
+    # ------------------------------------------
+    def framebuffer(self, enable=True):
+        # 켜면 그리기 함수는 RGB565 백버퍼에만 그리고, flush()에서 바뀐 영역만 화면으로 보냄
+        if enable:
+            if self._fb is None:
+                self._fb = memoryview(bytearray(self.width_limit * self.height_limit * 2))
+            self._dirty = []
+        elif self._fb is not None:
+            self.flush()
+            self.fence()
+            self._fb = None
+
+    def _fb_fillrect(self, x, y, w, h, color):
+        fb = self._fb
+        stride = self.width_limit * 2
+        o = (y * self.width_limit + x) * 2
+        n = w * 2
+        # 첫 줄은 2배씩 복사해서 채우고, 나머지 줄은 첫 줄을 그대로 복사
+        fb[o] = color >> 8
+        fb[o + 1] = color & 0xFF
+        k = 2
+        while k < n:
+            c = min(k, n - k)
+            fb[o + k:o + k + c] = fb[o:o + c]
+            k += c
+        row = fb[o:o + n]
+        p = o
+        for _ in range(h - 1):
+            p += stride
+            fb[p:p + n] = row
+        self._mark_dirty(x, y, x + w - 1, y + h - 1)
+
+    def _mark_dirty(self, x0, y0, x1, y1):
+        # 겹치거나 맞닿은 사각형은 하나로 합침
+        d = self._dirty
+        i = 0
+        while i < len(d):
+            r = d[i]
+            if x0 <= r[2] + 1 and r[0] <= x1 + 1 and y0 <= r[3] + 1 and r[1] <= y1 + 1:
+                x0 = min(x0, r[0]); y0 = min(y0, r[1])
+                x1 = max(x1, r[2]); y1 = max(y1, r[3])
+                d.pop(i)
+                i = 0
+            else:
+                i += 1
+        d.append((x0, y0, x1, y1))
+        if len(d) > MAX_DIRTY:
+            # 너무 잘게 쪼개지면 창 설정 비용이 커지므로 전체를 감싸는 사각형 하나로
+            x0 = min(r[0] for r in d); y0 = min(r[1] for r in d)
+            x1 = max(r[2] for r in d); y1 = max(r[3] for r in d)
+            self._dirty = [(x0, y0, x1, y1)]
+
+    def flush(self):
+        # 더티 사각형마다 창 설정 1번 + 데이터 전송 (CS 한 번)
+        if self._fb is None or not self._dirty:
+            return
+        if self._pipe is not None:
+            # 전송 버퍼에 복사만 하고 바로 돌아옴 (실제 전송은 전송 스레드에서)
+            self._pipe.flush(self._fb, self.width_limit, self._dirty)
+            self._dirty = []
+            return
+        fb = self._fb
+        stride = self.width_limit * 2
+        for x0, y0, x1, y1 in self._dirty:
+            self._set_window(x0, y0, x1, y1)
+            n = (x1 - x0 + 1) * 2
+            o = (y0 * self.width_limit + x0) * 2
+            rows = y1 - y0 + 1
+            self._dc.value(1)
+            self._cs.value(0)
+            if n == stride:
+                # 가로 전체 폭이면 메모리가 연속이므로 한 번에 전송
+                self._write(fb[o:o + n * rows])
+            else:
+                for _ in range(rows):
+                    self._write(fb[o:o + n])
+                    o += stride
+            self._cs.value(1)
+        self._dirty = []
+
+    def async_flush(self, enable=True, size=4096):
+        # 켜면 flush()가 전송을 기다리지 않음 (전송 버퍼 2개 x size 바이트 + 전송 스레드)
+        if enable:
+            if self._pipe is None:
+                from spiflush import FlushPipeline
+                self._pipe = FlushPipeline(self, size)
+        elif self._pipe is not None:
+            self._pipe.close()
+            self._pipe = None
+
+    def fence(self):
+        # 비동기 flush로 넘긴 전송이 모두 화면에 들어갈 때까지 기다림
+        if self._pipe is not None:
+            self._pipe.fence()
+
+    # ------------------------------------------
+    # SPI 프로파일
+    # ------------------------------------------
+    def profile(self, enable=True):
+        # 켜면 SPI 전송을 section() 태그별로 모으는 프로파일러를 돌려줌 (report()로 출력)
+        # 끄면 전송 함수가 원래대로 돌아가서 추가 비용 없음, 프로파일 중에는 비동기 flush를 끔
+        if enable:
+            if self._prof is None:
+                from spiprof import SpiProfiler
+                self._prof = SpiProfiler(self)
+            return self._prof
+        if self._prof is not None:
+            self._prof.close()
+            self._prof = None
+
+    def section(self, tag):
+        # with tft.section("aim"): ... 블록 안의 SPI 비용을 tag로 셈 (프로파일이 꺼져 있으면 빈 블록)
+        if self._prof is None:
+            return _NO_SECTION
+        return self._prof.section(tag)
+
     def rgb(self, enable):
         pass
\ No newline at end of file
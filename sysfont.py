@@ -1,14 +1,36 @@
 # sysfont.py
-# 5x7 시스템 폰트 데이터
+# 5x7 시스템 폰트 데이터 (ASCII 32~126)
+#
+# 글자 하나 = 5바이트, 바이트 하나 = 세로 한 열 (왼쪽 열부터, 최하위 비트가 맨 윗줄)
+# bytes 상수라 import가 가볍고, 보드에서 frozen 모듈로 넣으면 플래시에 그대로 남음
+WIDTH = 5
+HEIGHT = 7
+FIRST = 32
+LAST = 126
+
+FONT = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x5f\x00\x00\x00\x07\x00\x07\x00\x14\x7f\x14\x7f\x14\x24\x2a\x7f\x2a\x12\x23\x13\x08\x64\x62\x36\x49\x55\x22\x50\x00\x05\x03\x00\x00"  #  !"#$%&'
+    b"\x00\x1c\x22\x41\x00\x00\x41\x22\x1c\x00\x08\x2a\x1c\x2a\x08\x08\x08\x3e\x08\x08\x00\x50\x30\x00\x00\x08\x08\x08\x08\x08\x00\x60\x60\x00\x00\x20\x10\x08\x04\x02"  # ()*+,-./
+    b"\x3e\x51\x49\x45\x3e\x00\x42\x7f\x40\x00\x42\x61\x51\x49\x46\x21\x41\x45\x4b\x31\x18\x14\x12\x7f\x10\x27\x45\x45\x45\x39\x3c\x4a\x49\x49\x30\x01\x71\x09\x05\x03"  # 01234567
+    b"\x36\x49\x49\x49\x36\x06\x49\x49\x29\x1e\x00\x36\x36\x00\x00\x00\x56\x36\x00\x00\x08\x14\x22\x41\x00\x14\x14\x14\x14\x14\x00\x41\x22\x14\x08\x02\x01\x51\x09\x06"  # 89:;<=>?
+    b"\x32\x49\x79\x41\x3e\x7e\x11\x11\x11\x7e\x7f\x49\x49\x49\x36\x3e\x41\x41\x41\x22\x7f\x41\x41\x22\x1c\x7f\x49\x49\x49\x41\x7f\x09\x09\x01\x01\x3e\x41\x41\x51\x32"  # @ABCDEFG
+    b"\x7f\x08\x08\x08\x7f\x00\x41\x7f\x41\x00\x20\x40\x41\x3f\x01\x7f\x08\x14\x22\x41\x7f\x40\x40\x40\x40\x7f\x02\x04\x02\x7f\x7f\x04\x08\x10\x7f\x3e\x41\x41\x41\x3e"  # HIJKLMNO
+    b"\x7f\x09\x09\x09\x06\x3e\x41\x51\x21\x5e\x7f\x09\x19\x29\x46\x46\x49\x49\x49\x31\x01\x01\x7f\x01\x01\x3f\x40\x40\x40\x3f\x1f\x20\x40\x20\x1f\x7f\x20\x18\x20\x7f"  # PQRSTUVW
+    b"\x63\x14\x08\x14\x63\x03\x04\x78\x04\x03\x61\x51\x49\x45\x43\x00\x00\x7f\x41\x41\x02\x04\x08\x10\x20\x41\x41\x7f\x00\x00\x04\x02\x01\x02\x04\x40\x40\x40\x40\x40"  # XYZ[\]^_
+    b"\x00\x01\x02\x04\x00\x20\x54\x54\x54\x78\x7f\x48\x44\x44\x38\x38\x44\x44\x44\x20\x38\x44\x44\x48\x7f\x38\x54\x54\x54\x18\x08\x7e\x09\x01\x02\x08\x14\x54\x54\x3c"  # `abcdefg
+    b"\x7f\x08\x04\x04\x78\x00\x44\x7d\x40\x00\x20\x40\x44\x3d\x00\x00\x7f\x10\x28\x44\x00\x41\x7f\x40\x00\x7c\x04\x18\x04\x78\x7c\x08\x04\x04\x78\x38\x44\x44\x44\x38"  # hijklmno
+    b"\x7c\x14\x14\x14\x08\x08\x14\x14\x18\x7c\x7c\x08\x04\x04\x08\x48\x54\x54\x54\x20\x04\x3f\x44\x40\x20\x3c\x40\x40\x20\x7c\x1c\x20\x40\x20\x1c\x3c\x40\x30\x40\x3c"  # pqrstuvw
+    b"\x44\x28\x10\x28\x44\x0c\x50\x50\x50\x3c\x44\x64\x54\x4c\x44\x00\x08\x36\x41\x00\x00\x00\x7f\x00\x00\x00\x41\x36\x08\x00\x08\x04\x08\x10\x08"  # xyz{|}~
+)
+
+
+def glyph(ch):
+    # 글자의 5바이트 열 데이터 시작 위치 (없는 글자는 '?')
+    c = ord(ch)
+    if c < FIRST or c > LAST:
+        c = 63
+    return (c - FIRST) * WIDTH
+
+
 def get_font():
-    return {
-        # 간단한 5x7 폰트 데이터 (일부 특수문자 및 숫자, 대문자 포함)
-        # 용량을 줄이기 위해 필요한 부분만 포함하거나 전체 표준 폰트를 사용할 수 있습니다.
-        # 여기서는 드라이버 작동을 위한 필수 구조만 정의합니다.
-        # 실제 텍스트 출력을 위해서는 전체 sysfont.py가 필요합니다.
-        "width": 5, "height": 7, "map": {}
-    }
-    
-# *참고: 이 파일은 드라이버가 'import sysfont'를 할 때 에러가 나지 않게 하기 위한 필수 파일입니다.
-# 실제 글자를 예쁘게 쓰려면 긴 폰트 데이터가 필요하지만, 
-# 토끼(도형)를 그리는 데는 이정도 껍데기만 있어도 작동합니다.
\ No newline at end of file
+    return {"width": WIDTH, "height": HEIGHT, "first": FIRST, "last": LAST, "data": FONT}
\ No newline at end of file